@@ -3,7 +3,6 @@ EZSynchro - Automated Synchro Report Generator
 A sleek CLI tool for streamlined traffic simulation automation
 """
 
-import pyautogui
 import time
 import sys
 import os
@@ -11,8 +10,18 @@ import subprocess
 import platform
 from pathlib import Path
 import argparse
+import tempfile
+import re
+import glob
+import hashlib
+from functools import partial
+import json
+import csv
+import queue
+import threading
 from datetime import datetime
 from typing import Optional
+from contextlib import contextmanager
 
 # ANSI color codes for styling
 class Colors:
@@ -44,9 +53,9 @@ def print_banner():
 """
     print(banner)
 
-def print_status(step, message, status="info"):
-    """Print formatted status messages with timestamp"""
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
+def format_status(timestamp: float, step, message, status="info") -> str:
+    """Formatted status line with timestamp"""
+    timestamp = datetime.fromtimestamp(timestamp).strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
     
     if status == "info":
         color = Colors.OKBLUE
@@ -64,14 +73,142 @@ def print_status(step, message, status="info"):
         color = Colors.ENDC
         icon = "•"
     
-    print(f"{Colors.BOLD}[{timestamp}]{Colors.ENDC} {color}{icon} Step {step}:{Colors.ENDC} {message}")
+    return f"{Colors.BOLD}[{timestamp}]{Colors.ENDC} {color}{icon} Step {step}:{Colors.ENDC} {message}\n"
 
-def print_progress_bar(current, total, width=50):
-    """Display a sleek progress bar"""
+def format_progress_bar(current, total, width=50) -> str:
+    """Sleek progress bar, redrawn in place"""
     progress = int((current / total) * width)
     bar = "█" * progress + "░" * (width - progress)
     percentage = int((current / total) * 100)
-    print(f"\r{Colors.OKCYAN}Progress: [{bar}] {percentage}%{Colors.ENDC}", end="", flush=True)
+    return f"\r{Colors.OKCYAN}Progress: [{bar}] {percentage}%{Colors.ENDC}"
+
+MESSAGE_COLORS = {
+    "info": Colors.OKBLUE,
+    "notice": Colors.OKCYAN,
+    "success": Colors.OKGREEN,
+    "warning": Colors.WARNING,
+    "error": Colors.FAIL,
+    "header": Colors.BOLD + Colors.OKCYAN,
+}
+
+def format_event(timestamp: float, event: str, fields: dict) -> str:
+    """Console text for an automation event"""
+    if event == "step":
+        return format_status(timestamp, fields["step"], fields["message"], fields["status"])
+    if event == "progress":
+        return format_progress_bar(fields["current"], fields["total"], fields["width"])
+    if event == "scenario_start":
+        return (f"\n{Colors.BOLD}{Colors.HEADER}┌─ Processing Scenario "
+                f"{fields['scenario']}/{fields['total']} ─┐{Colors.ENDC}\n")
+    if event == "scenario_done":
+        return (f"\n{Colors.OKGREEN}└─ Scenario {fields['scenario']} completed in "
+                f"{fields['elapsed']:.2f}s ─┘{Colors.ENDC}\n")
+    if event == "export":
+        name = os.path.basename(fields["path"]) if fields["path"] else None
+        if fields["result"] == "saved":
+            return f"\n{Colors.OKGREEN}✓ Scenario {fields['scenario']} saved to {name}{Colors.ENDC}\n"
+        if fields["result"] == "duplicate":
+            return (f"\n{Colors.WARNING}⚠ Scenario {fields['scenario']} overwrote the previous scenario's "
+                    f"report {name}{Colors.ENDC}\n")
+        return f"\n{Colors.WARNING}⚠ Scenario {fields['scenario']}: {fields['detail']}{Colors.ENDC}\n"
+    if event == "message":
+        gap = "\n" if fields.get("gap") else ""
+        return f"{gap}{MESSAGE_COLORS[fields['level']]}{fields['text']}{Colors.ENDC}\n"
+    if event == "aborted":
+        if fields["reason"] == "failsafe":
+            return (f"\n{Colors.WARNING}╔══════════════════════════════════════════════════════════╗\n"
+                    f"║  {Colors.BOLD}⚠ AUTOMATION STOPPED BY FAILSAFE{Colors.ENDC}{Colors.WARNING}                   ║\n"
+                    f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+        if fields["reason"] == "cancelled":
+            return (f"\n{Colors.WARNING}╔══════════════════════════════════════════════════════════╗\n"
+                    f"║  {Colors.BOLD}⚠ AUTOMATION CANCELLED BY USER{Colors.ENDC}{Colors.WARNING}                      ║\n"
+                    f"║    User stopped process (Ctrl+C)                ║\n"
+                    f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+        return (f"\n{Colors.FAIL}╔══════════════════════════════════════════════════════════╗\n"
+                f"║  {Colors.BOLD}✗ AUTOMATION ERROR{Colors.ENDC}{Colors.FAIL}                               ║\n"
+                f"║    Error: {fields['error'][:45]:<45} ║\n"
+                f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
+    return ""
+
+def render_event(mode: str, timestamp: float, event: str, fields: dict) -> str:
+    """Text written for an event in console, quiet or json mode"""
+    if mode == "json":
+        record = {"time": datetime.fromtimestamp(timestamp).isoformat(timespec="milliseconds"), "event": event}
+        record.update(fields)
+        return json.dumps(record) + "\n"
+    if mode == "quiet":
+        problem = (event == "aborted"
+                   or (event == "export" and fields["result"] != "saved")
+                   or (event == "message" and fields["level"] in ("warning", "error")))
+        if not problem:
+            return ""
+    return format_event(timestamp, event, fields)
+
+class ConsoleRenderer:
+    """Draws automation events on a background thread, off the input path"""
+
+    def __init__(self, mode: str = "console", stream=None):
+        self.mode = mode
+        self.stream = stream or sys.stdout
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target=self._run, name="ezsynchro-renderer", daemon=True)
+
+    def emit(self, event: str, fields: dict):
+        self.queue.put((time.time(), event, fields))
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        """Draw everything still queued, then end the thread"""
+        self.queue.put(None)
+        self.thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            text = "".join(render_event(self.mode, *item) for item in batch if item is not None)
+            if text:
+                self.stream.write(text)
+                self.stream.flush()
+            if None in batch:
+                return
+
+_renderer: Optional[ConsoleRenderer] = None  # set while automation is running
+
+@contextmanager
+def console_renderer(mode: str = "console", stream=None):
+    """Route automation events through a background renderer for the duration"""
+    global _renderer
+    renderer = ConsoleRenderer(mode, stream)
+    renderer.start()
+    _renderer = renderer
+    try:
+        yield renderer
+    finally:
+        _renderer = None
+        renderer.stop()
+
+def emit(event: str, **fields):
+    """Hand an automation event to the renderer, or draw it straight away"""
+    if _renderer is not None:
+        _renderer.emit(event, fields)
+    else:
+        sys.stdout.write(format_event(time.time(), event, fields))
+        sys.stdout.flush()
+
+def print_status(step, message, status="info"):
+    """Print formatted status messages with timestamp"""
+    emit("step", step=step, message=message, status=status)
+
+def print_progress_bar(current, total, width=50):
+    """Display a sleek progress bar"""
+    emit("progress", current=current, total=total, width=width)
 
 def countdown(seconds, message="Starting"):
     """Animated countdown with style"""
@@ -138,9 +275,6 @@ def get_user_inputs() -> tuple[str, int, bool, bool]:
             if num_scenarios <= 0:
                 print(f"  {Colors.FAIL}✗ Number must be positive!{Colors.ENDC}")
                 continue
-            elif num_scenarios > 16:
-                print(f"  {Colors.FAIL}✗ Can only handle up to 16 scenarios!{Colors.ENDC}")
-                continue
             break
             
         
@@ -166,135 +300,2032 @@ def get_user_inputs() -> tuple[str, int, bool, bool]:
     
     return folder_path, num_scenarios, open_folder_after, export_pdf
 
-def key_burst(keys: list):
+class InputBackend:
+    """Mouse and keyboard actions used by the automation"""
+
+    name = "base"
+    failsafe_exception = ()  # exception raised when the failsafe corner is hit
+
+    def configure(self, pause: float, failsafe: bool):
+        raise NotImplementedError
+
+    def click(self, x: int, y: int):
+        raise NotImplementedError
+
+    def hotkey(self, *keys: str):
+        raise NotImplementedError
+
+    def press(self, key: str):
+        raise NotImplementedError
+
+    def write(self, text: str):
+        raise NotImplementedError
+
+    def press_keys(self, keys: list, interval: float = 0.0):
+        """Send several key presses as one call"""
+        for key in keys:
+            self.press(key)
+            if interval:
+                self.sleep(interval)
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def after_export(self, folder_path: str, scenario: int, extension: str):
+        """Called once the final export keystroke has been sent"""
+        pass
+
+    def screenshot(self) -> tuple:
+        """Image of every monitor and the screen coordinate of its top-left pixel"""
+        raise NotImplementedError
+
+    def screen_geometry(self) -> dict:
+        """Virtual desktop bounds, monitor count and DPI"""
+        raise NotImplementedError
+
+    def active_window_title(self) -> Optional[str]:
+        """Title of the foreground window, or None where it cannot be read"""
+        return None
+
+class PyAutoGUIBackend(InputBackend):
+    """Drives the live desktop through pyautogui"""
+
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self.gui = pyautogui
+        self.failsafe_exception = pyautogui.FailSafeException
+
+    def configure(self, pause: float, failsafe: bool):
+        self.gui.PAUSE = pause
+        self.gui.FAILSAFE = failsafe
+
+    def click(self, x: int, y: int):
+        self.gui.click(x, y)
+
+    def hotkey(self, *keys: str):
+        self.gui.hotkey(*keys)
+
+    def press(self, key: str):
+        self.gui.press(key)
+
+    def write(self, text: str):
+        self.gui.write(text)
+
+    def press_keys(self, keys: list, interval: float = 0.0):
+        # A single pyautogui call only pays PAUSE once for the whole run
+        self.gui.press(keys, interval=interval)
+
+    def active_window_title(self) -> Optional[str]:
+        try:
+            return self.gui.getActiveWindowTitle()
+        except (AttributeError, NotImplementedError):  # pygetwindow only supports Windows
+            return None
+
+    def screenshot(self) -> tuple:
+        geometry = self.screen_geometry()
+        if platform.system() == "Windows":
+            from PIL import ImageGrab
+            return ImageGrab.grab(all_screens=True), (geometry["left"], geometry["top"])
+        return self.gui.screenshot(), (0, 0)
+
+    def screen_geometry(self) -> dict:
+        if platform.system() == "Windows":
+            import ctypes
+            user32 = ctypes.windll.user32
+            try:
+                dpi = user32.GetDpiForSystem()
+            except AttributeError:  # Windows 8.1 and older
+                dpi = 96
+            # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN, SM_CMONITORS
+            left, top, width, height, monitors = (user32.GetSystemMetrics(index) for index in (76, 77, 78, 79, 80))
+            return {"left": left, "top": top, "width": width, "height": height, "monitors": monitors, "dpi": dpi}
+        width, height = self.gui.size()
+        return {"left": 0, "top": 0, "width": width, "height": height, "monitors": 1, "dpi": 96}
+
+def live_backend() -> PyAutoGUIBackend:
+    """Create the desktop backend, explaining why if it cannot start"""
+    try:
+        return PyAutoGUIBackend()
+    except Exception as e:  # pyautogui missing, or no display on a headless machine
+        print(f"{Colors.FAIL}✗ Cannot start desktop automation: {e}{Colors.ENDC}")
+        sys.exit(1)
+
+class FakeBackend(InputBackend):
+    """Records every action against a simulated clock instead of touching the desktop"""
+
+    name = "fake"
+
+    def __init__(self, render_time: float = 0.0, screenshots: Optional[list] = None,
+                 geometry: Optional[dict] = None):
+        self.render_time = render_time
+        self.screenshots = list(screenshots or [])
+        self.geometry = geometry or {"left": 0, "top": 0, "width": 1920, "height": 1080,
+                                     "monitors": 1, "dpi": 96}
+        self.pause = 0.0
+        self.failsafe = False
+        self.clock = 0.0
+        self.paused = 0.0
+        self.events = []
+        self._started = time.perf_counter()
+        self._scheduled = []
+        self._file_name_focused = False
+        self._file_name = None
+        self._open_dialog = False
+        self.window_title = "Synchro 11"
+
+    def _record(self, action: str, *args, pause: bool = True):
+        self.events.append({
+            "wall": time.perf_counter() - self._started,
+            "sim": self.clock,
+            "action": action,
+            "args": args,
+        })
+        if pause:
+            self.clock += self.pause
+            self.paused += self.pause
+            self._flush_exports()
+
+    def _flush_exports(self):
+        due = [item for item in self._scheduled if item[0] <= self.clock]
+        for item in due:
+            _, path, content = item
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(content)
+            self._scheduled.remove(item)
+
+    def configure(self, pause: float, failsafe: bool):
+        self.pause = pause
+        self.failsafe = failsafe
+
+    def click(self, x: int, y: int):
+        self._record("click", x, y)
+
+    def hotkey(self, *keys: str):
+        self._record("hotkey", *keys)
+        self._file_name_focused = keys == ('alt', 'n')
+        self._open_dialog = keys == ('ctrl', 'o')
+
+    def press(self, key: str):
+        self._record("press", key)
+
+    def write(self, text: str):
+        self._record("write", text)
+        if self._file_name_focused:
+            self._file_name = text
+        if self._open_dialog:
+            self.window_title = f"Synchro 11 - {os.path.basename(text)}"
+            self._open_dialog = False
+
+    def press_keys(self, keys: list, interval: float = 0.0):
+        # pyautogui waits `interval` after every key, the last one included
+        self.clock += interval * len(keys)
+        self._record("press_keys", *keys)
+
+    def active_window_title(self) -> Optional[str]:
+        return self.window_title
+
+    def sleep(self, seconds: float):
+        self._record("sleep", seconds, pause=False)
+        self.clock += seconds
+        self._flush_exports()
+
+    def now(self) -> float:
+        return self.clock
+
+    def after_export(self, folder_path: str, scenario: int, extension: str):
+        name = self._file_name or f"Scenario{scenario:02d}{extension}"
+        self._file_name = None
+        path = os.path.join(folder_path, name)
+        content = f"EZSynchro dry run\nScenario {scenario}\n"
+        if extension == ".pdf":
+            content = "%PDF-1.4\n% " + content + "%%EOF\n"
+        self._scheduled.append((self.clock + self.render_time, path, content))
+        self._flush_exports()
+
+    def screenshot(self) -> tuple:
+        self._record("screenshot", pause=False)
+        return self.screenshots.pop(0), (self.geometry["left"], self.geometry["top"])
+
+    def screen_geometry(self) -> dict:
+        return dict(self.geometry)
+
+    def summary(self) -> dict:
+        """Aggregate recorded actions into counts and simulated wait time"""
+        counts = {}
+        for event in self.events:
+            counts[event["action"]] = counts.get(event["action"], 0) + 1
+        inputs = len(self.events) - counts.get("sleep", 0) - counts.get("screenshot", 0)
+        keystrokes = sum(len(event["args"]) for event in self.events if event["action"] == "press_keys")
+        keystrokes += counts.get("press", 0)
+        slept = sum(event["args"][0] for event in self.events if event["action"] == "sleep")
+        return {
+            "actions": counts,
+            "inputs": inputs,
+            "keystrokes": keystrokes,
+            "sleep_time": slept,
+            "pause_time": self.paused,
+            "simulated_time": self.clock,
+        }
+
+def key_burst(backend: InputBackend, keys: list, interval: float = 0.0, batched: bool = True):
     """Key bursts with zero delays"""
+    pending = []
     for key in keys:
         if isinstance(key, tuple):  # For hotkeys
-            pyautogui.hotkey(*key)
+            if pending:
+                backend.press_keys(pending, interval)
+                pending = []
+            backend.hotkey(*key)
+        elif batched:  # one call per run of plain keys pays PAUSE once
+            pending.append(key)
+        else:
+            backend.press(key)
+            if interval:
+                backend.sleep(interval)
+    if pending:
+        backend.press_keys(pending, interval)
+
+class NoKeyGUI:
+    """Stands in for pyautogui with its PAUSE and interval sleeps but no key events"""
+
+    def __init__(self):
+        self.PAUSE = 0.1
+        self.FAILSAFE = True
+
+    def press(self, keys, interval: float = 0.0):
+        for _ in [keys] if isinstance(keys, str) else keys:
+            time.sleep(interval)
+        time.sleep(self.PAUSE)
+
+    def hotkey(self, *keys: str, interval: float = 0.0):
+        for _ in range(2 * len(keys)):  # key down, then key up in reverse
+            time.sleep(interval)
+        time.sleep(self.PAUSE)
+
+@contextmanager
+def stubbed_key_backend():
+    """A PyAutoGUIBackend whose platform key functions do nothing, for timing the real call path"""
+    backend = PyAutoGUIBackend.__new__(PyAutoGUIBackend)
+    try:
+        import pyautogui
+    except Exception:  # not installed, or no display to attach to
+        backend.gui = NoKeyGUI()
+        yield backend
+        return
+    backend.gui = pyautogui
+    backend.failsafe_exception = pyautogui.FailSafeException
+    platform_module = pyautogui.platformModule
+    saved = (platform_module._keyDown, platform_module._keyUp, pyautogui.PAUSE, pyautogui.FAILSAFE)
+    platform_module._keyDown = platform_module._keyUp = lambda key: None
+    try:
+        yield backend
+    finally:
+        platform_module._keyDown, platform_module._keyUp, pyautogui.PAUSE, pyautogui.FAILSAFE = saved
+
+def benchmark_key_injection(bursts: list, pause: float = 0.005, interval: float = 0.0) -> dict:
+    """Compare per-key and batched injection of the same key bursts"""
+    results = {}
+    for label, batched in (("per-key", False), ("batched", True)):
+        backend = FakeBackend()
+        backend.configure(pause=pause, failsafe=False)
+        for keys in bursts:
+            key_burst(backend, keys, interval, batched=batched)
+        summary = backend.summary()
+
+        # Same bursts through PyAutoGUIBackend, paying pyautogui's real sleeps
+        with stubbed_key_backend() as live:
+            live.configure(pause=pause, failsafe=False)
+            wall_start = time.perf_counter()
+            for keys in bursts:
+                key_burst(live, keys, interval, batched=batched)
+            wall = time.perf_counter() - wall_start
+
+        results[label] = {
+            "calls": summary["inputs"],
+            "keystrokes": summary["keystrokes"],
+            "simulated_time": summary["simulated_time"],
+            "wall": wall,
+            "keys_per_second": summary["keystrokes"] / wall if wall else float("inf"),
+        }
+    return results
+
+# Scenario rows that fit in the scenario menu before it starts scrolling, unless
+# calibration or --visible-rows says otherwise; PageDown moves one row less
+VISIBLE_SCENARIO_ROWS = 16
+SCENARIO_PAGE_SIZE = VISIBLE_SCENARIO_ROWS - 1
+
+def scenario_select_keys(scenario: int, page_size: int = SCENARIO_PAGE_SIZE) -> list:
+    """Keys that move the open scenario menu from the top to a scenario row"""
+    pages, rows = divmod(scenario - 1, page_size)
+    return ['home'] + ['pagedown'] * pages + ['down'] * rows + ['enter']
+
+class ScreenLayout:
+    """Screen positions of the Synchro elements the automation clicks"""
+
+    def __init__(self, menu: tuple = (-300, 110), canvas: tuple = (-1200, 700),
+                 first_row: tuple = (-300, 135), row_pitch: int = 25,
+                 visible_rows: int = VISIBLE_SCENARIO_ROWS):
+        self.menu = tuple(menu)
+        self.canvas = tuple(canvas)
+        self.first_row = tuple(first_row)
+        self.row_pitch = row_pitch
+        self.visible_rows = visible_rows
+
+    def row(self, scenario: int) -> tuple:
+        """Centre of a scenario's row in the open scenario menu"""
+        x, y = self.first_row
+        return x, y + self.row_pitch * (scenario - 1)
+
+    def to_dict(self) -> dict:
+        return {"menu": list(self.menu), "canvas": list(self.canvas),
+                "first_row": list(self.first_row), "row_pitch": self.row_pitch,
+                "visible_rows": self.visible_rows}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScreenLayout":
+        return cls(data["menu"], data["canvas"], data["first_row"], data["row_pitch"],
+                   data.get("visible_rows", VISIBLE_SCENARIO_ROWS))
+
+CALIBRATION_TEMPLATES = ("scenario_menu", "canvas", "scenario_row")
+# Optional crop of the menu's second row, used to measure the row pitch
+PITCH_TEMPLATE = "scenario_row_2"
+DEFAULT_ROW_PITCH = 25  # pixels at 96 dpi
+
+def default_calibration_path() -> Path:
+    return Path.home() / ".ezsynchro" / "calibration.json"
+
+def default_templates_path() -> Path:
+    return Path.home() / ".ezsynchro" / "templates"
+
+def geometry_key(geometry: dict) -> str:
+    """Cache key for a monitor arrangement - any change invalidates its layout"""
+    return ("{left},{top},{width}x{height}/{monitors}@{dpi}dpi").format(**geometry)
+
+def load_layout(backend: InputBackend, path: Optional[Path] = None) -> Optional[ScreenLayout]:
+    """Cached layout for the current monitor geometry, or None if not calibrated"""
+    try:
+        cache = json.loads(Path(path or default_calibration_path()).read_text(encoding="utf-8"))
+        return ScreenLayout.from_dict(cache[geometry_key(backend.screen_geometry())])
+    except (OSError, ValueError, KeyError, NotImplementedError):
+        return None
+
+def save_layout(backend: InputBackend, layout: ScreenLayout, path: Optional[Path] = None):
+    path = Path(path or default_calibration_path())
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    cache[geometry_key(backend.screen_geometry())] = layout.to_dict()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+def locate_template(screenshot, template, origin: tuple = (0, 0)) -> Optional[tuple]:
+    """Screen coordinate of the centre of a template image inside a screenshot"""
+    import pyscreeze
+    try:
+        box = pyscreeze.locate(template, screenshot)
+    except getattr(pyscreeze, "ImageNotFoundException", ()):
+        box = None
+    if box is None:
+        return None
+    left, top, width, height = box
+    return origin[0] + left + width // 2, origin[1] + top + height // 2
+
+def calibrate_layout(backend: InputBackend, templates: dict, row_pitch: Optional[int] = None,
+                     menu_delay: float = 0.5, visible_rows: int = VISIBLE_SCENARIO_ROWS) -> ScreenLayout:
+    """Find the scenario menu, canvas and scenario rows on screen"""
+    screenshot, origin = backend.screenshot()
+    found = {}
+    for name in ("scenario_menu", "canvas"):
+        found[name] = locate_template(screenshot, templates[name], origin)
+        if found[name] is None:
+            raise ValueError(f"'{name}' not found on screen")
+
+    # Scenario rows only show while the menu is open
+    backend.click(*found["scenario_menu"])
+    backend.sleep(menu_delay)
+    screenshot, origin = backend.screenshot()
+    backend.press('escape')
+    found["scenario_row"] = locate_template(screenshot, templates["scenario_row"], origin)
+    if found["scenario_row"] is None:
+        raise ValueError("'scenario_row' not found in the open scenario menu")
+
+    if PITCH_TEMPLATE in templates:
+        second_row = locate_template(screenshot, templates[PITCH_TEMPLATE], origin)
+        if second_row is None or second_row[1] <= found["scenario_row"][1]:
+            raise ValueError(f"'{PITCH_TEMPLATE}' not found below the first row")
+        row_pitch = second_row[1] - found["scenario_row"][1]
+    elif row_pitch is None:  # no second row to measure - scale the 96 dpi pitch
+        row_pitch = round(DEFAULT_ROW_PITCH * backend.screen_geometry().get("dpi", 96) / 96)
+
+    return ScreenLayout(found["scenario_menu"], found["canvas"], found["scenario_row"], row_pitch,
+                        visible_rows)
+
+def natural_sort_key(name: str) -> list:
+    """Sort key matching Explorer's ordering, so Scenario 10 follows Scenario 9"""
+    return [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', name)]
+
+def report_targets(folder_path: str, extension: str) -> list:
+    """Existing report files in the order the save dialog lists them"""
+    names = [os.path.basename(path) for path in snapshot_outputs(folder_path, extension)]
+    return sorted(names, key=natural_sort_key)
+
+def select_file_by_name(backend: InputBackend, file_name: str, profile: "TimingProfile"):
+    """Type the target file into the save dialog's File name box"""
+    backend.hotkey('alt', 'n')
+    backend.sleep(profile.delay("address_bar"))
+    backend.write(file_name)
+
+def snapshot_outputs(folder_path: str, extension: str) -> dict:
+    """Record size and mtime of every report file in the output folder"""
+    snapshot = {}
+    try:
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(extension):
+                    stat = entry.stat()
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        pass
+    return snapshot
+
+class StepTimer:
+    """Collects per-step latencies across one or more batch runs"""
+
+    def __init__(self, clock=time.monotonic, backend_name: str = ""):
+        self.clock = clock
+        self.backend_name = backend_name
+        self.run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+        self.run = 0
+        self.records = []
+
+    @contextmanager
+    def step(self, scenario: Optional[int], name: str):
+        start = self.clock()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append({
+                "run_id": self.run_id,
+                "run": self.run,
+                "backend": self.backend_name,
+                "scenario": scenario,
+                "step": name,
+                "duration": self.clock() - start,
+                "wall": time.perf_counter() - wall_start,
+            })
+
+    def write_log(self, path: str):
+        """Append the collected records to a .jsonl or .csv run log"""
+        if not self.records:
+            return
+        if path.lower().endswith(".csv"):
+            new_file = not os.path.exists(path)
+            with open(path, "a", newline="", encoding="utf-8") as handle:
+                writer = csv.DictWriter(handle, fieldnames=list(self.records[0]))
+                if new_file:
+                    writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(path, "a", encoding="utf-8") as handle:
+                for record in self.records:
+                    handle.write(json.dumps(record) + "\n")
+
+DEFAULT_DELAYS = {
+    "pause": 0.005,           # pyautogui.PAUSE after every input call
+    "select_menu": 0.05,      # scenario menu opening
+    "select_row": 0.05,       # scenario row click
+    "focus": 0.05,            # click on the Synchro canvas
+    "report_menu": 0.05,      # ctrl+r create report dialog
+    "export_dialog": 0.8,     # .txt export dialog opening
+    "export_dialog_pdf": 1.8, # print-to-PDF dialog opening
+    "address_bar": 0.02,      # ctrl+l / alt+d address bar focus
+    "directory": 0.4,         # output directory change
+    "confirm": 0.15,          # save / overwrite confirmation
+    "key_interval": 0.0,      # gap between keys inside one batched burst
+    "open_dialog": 1.0,       # ctrl+o open project dialog
+    "project_load": 5.0,      # Synchro loading a project file
+}
+
+def default_profile_path() -> Path:
+    """Per-machine location of the learned timing profile"""
+    machine = platform.node() or "default"
+    return Path.home() / ".ezsynchro" / f"timing-{machine}.json"
+
+class TimingProfile:
+    """Adaptive delays between automation steps, saved per workstation"""
+
+    def __init__(self, delays: Optional[dict] = None, adaptive: bool = False,
+                 shrink: float = 0.85, backoff: float = 1.25, min_factor: float = 0.1,
+                 decay_after: int = 10):
+        self.delays = dict(DEFAULT_DELAYS)
+        self.delays.update(delays or {})
+        self.min_floors = {name: value * min_factor for name, value in DEFAULT_DELAYS.items()}
+        self.floors = dict(self.min_floors)
+        self.last_good = dict(self.delays)
+        self.adaptive = adaptive
+        self.shrink = shrink
+        self.backoff = backoff
+        self.decay_after = decay_after
+        self.successes = 0
+        self.failures = 0
+        self.streak = 0
+        self.used = set()  # delays read since the last take_used()
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> "TimingProfile":
+        profile = cls(**kwargs)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return profile
+        known = lambda values: {k: float(v) for k, v in values.items() if k in DEFAULT_DELAYS}
+        profile.delays.update(known(data.get("delays", {})))
+        profile.floors.update({name: min(value, DEFAULT_DELAYS[name])
+                               for name, value in known(data.get("floors", {})).items()})
+        profile.last_good = dict(profile.delays)
+        return profile
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "delays": self.last_good,
+            "floors": self.floors,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    def delay(self, name: str) -> float:
+        self.used.add(name)
+        return self.delays[name]
+
+    def take_used(self) -> set:
+        """Delays read since the last call, to credit or blame one export with"""
+        used, self.used = self.used, set()
+        return used
+
+    def record_success(self, used: Optional[set] = None):
+        """Export verified - remember the delays it used and try slightly shorter ones"""
+        used = self.take_used() if used is None else used
+        self.successes += 1
+        self.streak += 1
+        for name in used:
+            self.last_good[name] = self.delays[name]
+            if self.adaptive:
+                if self.streak > self.decay_after:
+                    # A long clean run lets floors raised by earlier failures relax again
+                    self.floors[name] = max(self.min_floors[name], self.floors[name] * self.shrink)
+                self.delays[name] = max(self.floors[name], self.delays[name] * self.shrink)
+
+    def record_failure(self, used: Optional[set] = None):
+        """Export missing or wrong - back off and stay above the delays that failed"""
+        used = self.take_used() if used is None else used
+        self.failures += 1
+        self.streak = 0
+        if self.adaptive:
+            for name in used:
+                # Floors never pass the stock timings, so --speed is never slower than normal mode
+                self.floors[name] = min(DEFAULT_DELAYS[name],
+                                        max(self.floors[name], self.delays[name] * self.backoff))
+                self.delays[name] = max(self.floors[name], self.last_good[name] * self.backoff)
+                self.last_good[name] = self.delays[name]
+
+def percentile(values: list, pct: float) -> float:
+    """Linearly interpolated percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def print_bench_report(records: list):
+    """Print p50/p95/max latency per step and per scenario"""
+    by_step = {}
+    by_scenario = {}
+    for record in records:
+        by_step.setdefault(record["step"], []).append(record["duration"])
+        if record["scenario"] is not None:
+            key = (record["run"], record["scenario"])
+            by_scenario[key] = by_scenario.get(key, 0.0) + record["duration"]
+
+    scenario_totals = {}
+    for (_, scenario), total in by_scenario.items():
+        scenario_totals.setdefault(scenario, []).append(total)
+
+    def print_table(title, rows):
+        print(f"\n{Colors.BOLD}{title:<22}{'n':>5}{'p50':>10}{'p95':>10}{'max':>10}{Colors.ENDC}")
+        for label, values in rows:
+            print(f"  {str(label):<20}{len(values):>5}"
+                  f"{percentile(values, 50):>9.3f}s{percentile(values, 95):>9.3f}s{max(values):>9.3f}s")
+
+    print(f"\n{Colors.OKCYAN}╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {Colors.BOLD}BENCHMARK REPORT{Colors.ENDC}{Colors.OKCYAN}                                          ║")
+    print(f"╚════════════════════════════════════════════════════════════╝{Colors.ENDC}")
+    print_table("Step", list(by_step.items()))
+    print_table("Scenario", sorted(scenario_totals.items()))
+
+def report_complete(path: str) -> bool:
+    """False for a PDF whose %%EOF trailer has not been written yet"""
+    if not path.lower().endswith(".pdf"):
+        return True
+    try:
+        with open(path, "rb") as handle:
+            handle.seek(max(0, os.path.getsize(path) - 1024))
+            return b"%%EOF" in handle.read()
+    except OSError:
+        return False
+
+class ExportScheduler:
+    """Tracks report exports that are still being written by Synchro"""
+
+    def __init__(self, folder_path: str, extension: str, timeout: float, depth: int = 0,
+                 poll_interval: float = 0.05, settle_time: float = 0.25, on_complete=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.folder_path = folder_path
+        self.extension = extension
+        self.timeout = timeout
+        self.depth = max(0, depth)  # exports left in flight while the next scenario starts
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.on_complete = on_complete
+        self.clock = clock
+        self.sleep = sleep
+        self.pending = []
+        self.results = {}
+        self._claimed = {}  # path -> signature it had when attributed to an export
+        self._first_seen = {}
+
+    def snapshot(self) -> dict:
+        return snapshot_outputs(self.folder_path, self.extension)
+
+    def submit(self, scenario: int, before: dict):
+        """Register an export whose final keystroke has just been sent"""
+        self.pending.append({
+            "scenario": scenario,
+            "before": before,
+            "deadline": self.clock() + self.timeout,
+            "candidate": None,
+            "size": None,
+            "stable_since": 0.0,
+        })
+        self.wait(self.depth)
+
+    def wait(self, depth: int = 0):
+        """Block until at most `depth` exports are still in flight"""
+        while True:
+            self.poll()
+            if len(self.pending) <= depth:
+                return
+            self.sleep(self.poll_interval)
+
+    def drain(self):
+        self.wait(0)
+
+    def poll(self):
+        """Harvest finished exports in submission order without blocking"""
+        current = self.snapshot()
+        while self.pending:
+            now = self.clock()
+            head = self.pending[0]
+            changed = [path for path, signature in current.items()
+                       if head["before"].get(path) != signature and self._claimed.get(path) != signature]
+            for path in changed:
+                self._first_seen.setdefault(path, now)
+
+            if changed:
+                # The earliest file to start changing belongs to the oldest export
+                path = min(changed, key=lambda p: self._first_seen[p])
+                size = current[path][0]
+                if path != head["candidate"] or size != head["size"] or size == 0:
+                    # Still being written - restart the settle window
+                    head["candidate"], head["size"], head["stable_since"] = path, size, now
+                elif now - head["stable_since"] >= self.settle_time and report_complete(path):
+                    self._complete(path, current[path])
+                    continue
+
+            if now >= head["deadline"]:
+                self._complete(None)
+                continue
+            return
+
+    def _complete(self, path: Optional[str], signature: Optional[tuple] = None):
+        entry = self.pending.pop(0)
+        if path is not None:
+            self._claimed[path] = signature
+            self._first_seen.pop(path, None)
+        self.results[entry["scenario"]] = path
+        if self.on_complete:
+            self.on_complete(entry["scenario"], path)
+
+MANIFEST_NAME = "ezsynchro_manifest.json"
+
+def file_sha256(path: str) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ExportManifest:
+    """Record of completed scenario exports kept in the output folder"""
+
+    def __init__(self, folder_path: str, entries: Optional[dict] = None):
+        self.folder_path = folder_path
+        self.path = os.path.join(folder_path, MANIFEST_NAME)
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, folder_path: str) -> "ExportManifest":
+        try:
+            with open(os.path.join(folder_path, MANIFEST_NAME), encoding="utf-8") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return cls(folder_path)
+        return cls(folder_path, data.get("scenarios", {}))
+
+    def save(self):
+        data = {"version": 1, "scenarios": self.entries}
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as handle:
+                json.dump(data, handle, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"\n{Colors.WARNING}⚠ Could not update manifest: {e}{Colors.ENDC}")
+
+    def record(self, scenario: int, output_file: str, sha256: Optional[str] = None,
+               inputs: Optional[dict] = None):
+        """Store a finished export and persist the manifest immediately"""
+        stat = os.stat(output_file)
+        self.entries[str(scenario)] = {
+            "path": os.path.basename(output_file),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": sha256 or file_sha256(output_file),
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if inputs is not None:
+            self.entries[str(scenario)]["inputs"] = inputs
+        self.save()
+
+    def forget(self, scenarios: list):
+        """Drop the entries of scenarios whose recorded export is no longer trusted"""
+        removed = [str(scenario) for scenario in scenarios if self.entries.pop(str(scenario), None)]
+        if removed:
+            self.save()
+
+    def inputs_changed(self, scenario: int, inputs: dict) -> bool:
+        """True unless the scenario's last export recorded exactly these input hashes"""
+        recorded = self.entries.get(str(scenario), {}).get("inputs")
+        return not recorded or recorded != inputs
+
+    def is_valid(self, scenario: int, extension: str) -> bool:
+        """True if the recorded output for a scenario is still on disk unchanged"""
+        entry = self.entries.get(str(scenario))
+        if not entry or not entry["path"].lower().endswith(extension):
+            return False
+        path = os.path.join(self.folder_path, entry["path"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime"]:
+            return True
+        return file_sha256(path) == entry["sha256"]
+
+# "Scenario 3", "Scenario03", "scn_3" in a report name or text header
+SCENARIO_PATTERN = re.compile(r"(?:scenario|scn)[\s_-]*#?\s*0*(\d+)", re.IGNORECASE)
+HEADER_BYTES = 4096
+RETRY_BACKOFF = 2.0  # seconds before the first retry pass, doubled for each further pass
+
+def scenario_mentions(output_file: str, include_name: bool = True) -> set:
+    """Scenario numbers named in a report's file name or, for .txt, its header"""
+    text = os.path.basename(output_file) if include_name else ""
+    if output_file.lower().endswith(".txt"):
+        with open(output_file, encoding="utf-8", errors="replace") as handle:
+            text += "\n" + handle.read(HEADER_BYTES)
+    return {int(number) for number in SCENARIO_PATTERN.findall(text)}
+
+def verify_export(output_file: Optional[str], scenario: int, expected_name: Optional[str] = None,
+                  previous: Optional[tuple] = None, num_scenarios: Optional[int] = None) -> tuple:
+    """Check one export and return (problem, sha256) - problem is None for a good report"""
+    if output_file is None or not os.path.isfile(output_file):
+        return "no output detected", None
+    if os.path.getsize(output_file) == 0:
+        return f"{os.path.basename(output_file)} is empty", None
+    if not report_complete(output_file):
+        return f"{os.path.basename(output_file)} is truncated", None
+    if expected_name and os.path.basename(output_file).lower() != expected_name.lower():
+        return f"wrote {os.path.basename(output_file)} instead of {expected_name}", None
+    # The right file name says nothing about which scenario row was exported into it
+    mentions = scenario_mentions(output_file, include_name=not expected_name)
+    if num_scenarios:
+        mentions = {number for number in mentions if 1 <= number <= num_scenarios}
+    if mentions and scenario not in mentions:
+        return f"{os.path.basename(output_file)} is a report for scenario {min(mentions)}", None
+    sha256 = file_sha256(output_file)
+    if previous and (output_file == previous[0] or sha256 == previous[1]):
+        return "duplicate", sha256
+    return None, sha256
+
+def input_fingerprints(num_scenarios: int, project: Optional[str] = None,
+                       inputs: Optional[str] = None) -> dict:
+    """Hash the files each scenario's reports are exported from, as {scenario: {path: sha256}}"""
+    hashes = {}
+
+    def fingerprint(paths):
+        for path in paths:
+            if path not in hashes:
+                hashes[path] = file_sha256(path)
+        return {path: hashes[path] for path in paths}
+
+    # The project is shared, so any saved change to it makes every scenario stale
+    shared = [os.path.abspath(project)] if project else []
+    fingerprints = {}
+    unmatched = []
+    for scenario in range(1, num_scenarios + 1):
+        # `inputs` names each scenario's own files, e.g. 'data/scenario{n}_*.csv'
+        own = sorted(glob.glob(inputs.replace("{n}", str(scenario)))) if inputs else []
+        if inputs and not own:
+            unmatched.append(scenario)
+        fingerprints[scenario] = fingerprint(shared + [os.path.abspath(path) for path in own])
+    if unmatched:
+        raise ValueError(f"'{inputs}' matches no files for scenario(s) {format_scenarios(unmatched)}")
+    return fingerprints
+
+def parse_scenario_spec(spec: str, num_scenarios: int) -> list:
+    """Expand a selection like '5,9-12' into sorted scenario numbers"""
+    selected = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = (value.strip() for value in part.split("-", 1))
+            if not (start.isdigit() and end.isdigit()):
+                raise ValueError(f"range {part} needs a first and last scenario, e.g. 2-5")
+            start, end = int(start), int(end)
+            if start > end:
+                raise ValueError(f"range {part} is reversed - use {end}-{start}")
+            selected.update(range(start, end + 1))
+        elif part.isdigit():
+            selected.add(int(part))
+        else:
+            raise ValueError(f"'{part}' is not a scenario number or range")
+    if not selected:
+        raise ValueError("selection is empty")
+    invalid = [scenario for scenario in selected if not 1 <= scenario <= num_scenarios]
+    if invalid:
+        raise ValueError(f"scenario(s) {', '.join(map(str, sorted(invalid)))} outside 1-{num_scenarios}")
+    return sorted(selected)
+
+def format_scenarios(scenarios: list) -> str:
+    """Compact scenario list, e.g. [1, 2, 3, 7] -> '1-3,7'"""
+    parts = []
+    for scenario in scenarios:
+        if parts and scenario == parts[-1][1] + 1:
+            parts[-1][1] = scenario
+        else:
+            parts.append([scenario, scenario])
+    return ",".join(str(start) if start == end else f"{start}-{end}" for start, end in parts)
+
+def plan_scenarios(folder_path: str, num_scenarios: int, extension: str,
+                   only: Optional[str] = None, resume: bool = False,
+                   fingerprints: Optional[dict] = None) -> list:
+    """Scenarios to export after applying --only, --resume and --changed-only"""
+    plan = parse_scenario_spec(only, num_scenarios) if only is not None else list(range(1, num_scenarios + 1))
+    if resume or fingerprints:
+        manifest = ExportManifest.load(folder_path)
+        plan = [scenario for scenario in plan
+                if not manifest.is_valid(scenario, extension)
+                or (fingerprints and manifest.inputs_changed(scenario, fingerprints[scenario]))]
+    return plan
+
+PDF_PAGE_WIDTH = 792    # US Letter landscape, in points
+PDF_PAGE_HEIGHT = 612
+PDF_MARGIN = 36
+PDF_FONT_SIZE = 8
+PDF_LEADING = 9.6
+
+def _pdf_escape(line: str) -> bytes:
+    text = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    return text.encode("latin-1", errors="replace")
+
+def render_text_pdf(txt_path: str, pdf_path: Optional[str] = None) -> str:
+    """Render a plain-text report to a monospaced PDF next to it"""
+    pdf_path = pdf_path or os.path.splitext(txt_path)[0] + ".pdf"
+    lines_per_page = int((PDF_PAGE_HEIGHT - 2 * PDF_MARGIN) // PDF_LEADING)
+
+    pages = [[]]
+    with open(txt_path, encoding="utf-8", errors="replace") as handle:
+        for raw_line in handle:
+            # Form feeds start a new page, as they do when Synchro prints
+            chunks = raw_line.rstrip("\r\n").split("\f")
+            for index, chunk in enumerate(chunks):
+                if index > 0 and pages[-1]:
+                    pages.append([])
+                if index < len(chunks) - 1 and not chunk:
+                    continue
+                if len(pages[-1]) >= lines_per_page:
+                    pages.append([])
+                pages[-1].append(chunk.expandtabs(8))
+
+    top = PDF_PAGE_HEIGHT - PDF_MARGIN
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for lines in pages:
+        stream = b"BT /F1 %d Tf %.1f TL %d %d Td " % (PDF_FONT_SIZE, PDF_LEADING, PDF_MARGIN, top)
+        stream += b"".join(b"(" + _pdf_escape(line) + b") ' " for line in lines) + b"ET"
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>"
+                       % (PDF_PAGE_WIDTH, PDF_PAGE_HEIGHT, content_ref))
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(page_refs)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    temp_path = pdf_path + ".tmp"
+    with open(temp_path, "wb") as handle:
+        handle.write(output)
+    os.replace(temp_path, pdf_path)
+    return pdf_path
+
+def pdf_output_path(txt_path: str) -> str:
+    return os.path.splitext(txt_path)[0] + ".pdf"
+
+REPORT_COLUMNS = ("scenario", "section", "intersection", "movement", "metric", "value")
+TABLE_FOLDER = "tables"
+
+# First cells of the rows that name the columns of the rows below them
+COLUMN_HEADER_LABELS = {"movement", "lane group", "lane", "approach"}
+INTERSECTION_PATTERN = re.compile(r"^\d+\s*:\s*\S")
+# Page footers, e.g. "Scenario 1 AM Existing ... Synchro 11 Report" and "Page 3"
+REPORT_FOOTER_PATTERN = re.compile(r"\bSynchro\s+\d+\s+Report\b|^Page\s+\d+$", re.IGNORECASE)
+# Summary items written without a colon, e.g. "ICU Level of Service B"
+TRAILING_VALUE_PATTERN = re.compile(r"^(.*\S)\s+([-+]?\d[\d.,]*%?|[A-F])$")
+
+def split_report_line(line: str) -> list:
+    """Split a report line into cells - Synchro separates columns with tabs"""
+    line = line.replace("\f", "").rstrip("\r\n")
+    if "\t" in line:
+        cells = [cell.strip() for cell in line.split("\t")]
+    else:
+        cells = re.split(r"\s{2,}", line.strip())
+    while cells and not cells[-1]:
+        cells.pop()
+    return cells
+
+def summary_pairs(cells: list) -> list:
+    """(metric, value) pairs from an Intersection Summary line"""
+    # "Metric: value" items, up to two a line, with the value in the same cell or the next
+    pairs = []
+    pending = None
+    for cell in cells:
+        if pending is not None:
+            if ":" not in cell:
+                pairs.append((pending, cell))
+                pending = None
+                continue
+            pending = None
+        metric, colon, value = cell.partition(":")
+        if colon:
+            if value.strip():
+                pairs.append((metric.strip(), value.strip()))
+            else:
+                pending = metric.strip()
+            continue
+        match = TRAILING_VALUE_PATTERN.match(cell)
+        if match:
+            pairs.append(match.groups())
+        else:
+            pending = cell
+    return pairs
+
+def iter_report_rows(txt_path: str, scenario: Optional[str] = None):
+    """Yield (scenario, section, intersection, movement, metric, value) rows from a Synchro text report"""
+    scenario = scenario or Path(txt_path).stem
+    intersection = title = table = None
+    columns = []
+    in_summary = False
+
+    with open(txt_path, encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            if "\f" in line or REPORT_FOOTER_PATTERN.search(line.strip()):
+                intersection, title, columns, in_summary = None, None, [], False
+                if REPORT_FOOTER_PATTERN.search(line.strip()):
+                    continue
+            cells = split_report_line(line)
+            if not cells or not cells[0]:
+                continue
+            label = cells[0]
+
+            if INTERSECTION_PATTERN.match(label):
+                intersection, table, columns, in_summary = label, None, [], False
+                continue
+            if intersection is None:
+                # The first line of a page is the report title
+                title = title or label
+                continue
+            if label.lower() in COLUMN_HEADER_LABELS:
+                table, columns, in_summary = label, cells[1:], False
+                continue
+            if label.lower().startswith("intersection summary"):
+                table, in_summary = "Intersection Summary", True
+                continue
+            if label.lower().startswith("splits and phases"):
+                # The phase diagram that closes the summary holds no metrics
+                table, columns, in_summary = None, [], False
+                continue
+
+            section = " / ".join(part for part in (title, table) if part)
+            if in_summary:
+                items = [cell for cell in cells if cell and not INTERSECTION_PATTERN.match(cell)]
+                for metric, value in summary_pairs(items):
+                    yield (scenario, section, intersection, "Intersection", metric, value)
+                continue
+            values = cells[1:]
+            for movement, value in zip(columns, values):
+                if movement and value:
+                    yield (scenario, section, intersection, movement, label, value)
+
+def table_output_path(txt_path: str, fmt: str = "csv") -> str:
+    folder_path, name = os.path.split(txt_path)
+    return os.path.join(folder_path, TABLE_FOLDER, os.path.splitext(name)[0] + "." + fmt)
+
+def parse_report(txt_path: str, fmt: str = "csv", out_path: Optional[str] = None) -> str:
+    """Write one scenario's report as a columnar CSV or Parquet table"""
+    out_path = out_path or table_output_path(txt_path, fmt)
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    rows = iter_report_rows(txt_path)
+
+    if fmt == "parquet":
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        columns = list(zip(*rows)) or [()] * len(REPORT_COLUMNS)
+        table = pyarrow.table({name: list(values) for name, values in zip(REPORT_COLUMNS, columns)})
+        pyarrow.parquet.write_table(table, out_path)
+        return out_path
+
+    with open(out_path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(rows)
+    return out_path
+
+# Bumped whenever parsed rows change shape, so cached objects are re-parsed
+INDEX_FORMAT = 2
+
+def default_index_path() -> Path:
+    return Path.home() / ".ezsynchro" / "index"
+
+class ReportIndex:
+    """On-disk cache of parsed report metrics keyed by report content hash"""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or default_index_path())
+        self.catalog_path = self.root / "catalog.json"
+        self.catalog = {}
+        self._dirty = False
+        try:
+            self.catalog = json.loads(self.catalog_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / f"v{INDEX_FORMAT}" / digest[:2] / f"{digest}.json"
+
+    def digest(self, txt_path: str) -> str:
+        """Content hash of a report, reusing the catalog when the file is unchanged"""
+        key = os.path.abspath(txt_path)
+        stat = os.stat(key)
+        entry = self.catalog.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        digest = file_sha256(key)
+        history = entry["history"] if entry else []
+        if not history or history[-1]["sha256"] != digest:
+            history.append({"sha256": digest, "indexed_at": datetime.now().isoformat(timespec="seconds")})
+        self.catalog[key] = {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": digest,
+            "scenario": Path(key).stem,
+            "history": history,
+        }
+        self._dirty = True
+        return digest
+
+    def rows(self, txt_path: str) -> list:
+        """Parsed (section, intersection, movement, metric, value) rows for a report"""
+        digest = self.digest(txt_path)
+        cached = self.load(digest)
+        if cached is not None:
+            return cached
+
+        rows = [list(row[1:]) for row in iter_report_rows(txt_path)]
+        object_path = self._object_path(digest)
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = object_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(rows), encoding="utf-8")
+        os.replace(temp_path, object_path)
+        return rows
+
+    def load(self, digest: str) -> Optional[list]:
+        try:
+            return json.loads(self._object_path(digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def resolve_hash(self, prefix: str) -> Optional[str]:
+        """Full hash of an indexed report from a unique prefix"""
+        matches = {item["sha256"] for entry in self.catalog.values() for item in entry["history"]
+                   if item["sha256"].startswith(prefix)}
+        return matches.pop() if len(matches) == 1 else None
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp_path = self.catalog_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self.catalog, indent=1), encoding="utf-8")
+        os.replace(temp_path, self.catalog_path)
+        self._dirty = False
+
+# Queue footnote markers: "#" 95th percentile exceeds capacity, "~" volume exceeds capacity,
+# "m" metered by the upstream signal; percentages compare as plain numbers
+METRIC_NUMBER_PATTERN = re.compile(r"[#~]*\s*([-+]?(?:\d[\d,]*)?\.?\d+)\s*[m%]?")
+
+def _metric_number(value: str) -> Optional[float]:
+    match = METRIC_NUMBER_PATTERN.fullmatch(value.strip())
+    if not match:
+        return None
+    return float(match.group(1).replace(",", ""))
+
+def compare_rows(base: list, other: list, metrics: Optional[list] = None,
+                 intersection: Optional[str] = None, include_unchanged: bool = False) -> list:
+    """Per-movement differences between two reports' parsed rows"""
+    def keyed(rows):
+        return {(row[0], row[1], row[2], row[3]): row[4] for row in rows}
+
+    base_values, other_values = keyed(base), keyed(other)
+    order = list(base_values) + [key for key in other_values if key not in base_values]
+    wanted = [metric.lower() for metric in metrics or []]
+
+    deltas = []
+    for key in order:
+        section, name, movement, metric = key
+        if wanted and not any(term in metric.lower() for term in wanted):
+            continue
+        if intersection and intersection.lower() not in name.lower():
+            continue
+        before, after = base_values.get(key, ""), other_values.get(key, "")
+        if before == after and not include_unchanged:
+            continue
+        before_number, after_number = _metric_number(before), _metric_number(after)
+        if before_number is not None and after_number is not None:
+            change = f"{after_number - before_number:+.2f}"
         else:
-            pyautogui.press(key)
+            change = "=" if before == after else "changed"
+        deltas.append((section, name, movement, metric, before, after, change))
+    return deltas
+
+class ReportPool:
+    """Post-processes verified .txt reports on a shared process pool"""
 
-def automate_synchro_process(folder_path: str, num_scenarios: int, export_pdf: bool = False):
+    def __init__(self, executor, task, output_for, summary: str):
+        self.executor = executor
+        self.task = task
+        self.output_for = output_for
+        self.summary = summary
+        self.futures = {}
+
+    def submit(self, txt_path: str):
+        if txt_path not in self.futures:
+            self.futures[txt_path] = self.executor.submit(self.task, txt_path)
+
+    def sweep(self, folder_path: str):
+        """Queue every .txt report whose output is missing or older than the text"""
+        for txt_path in snapshot_outputs(folder_path, ".txt"):
+            out_path = self.output_for(txt_path)
+            if not os.path.exists(out_path) or os.path.getmtime(out_path) < os.path.getmtime(txt_path):
+                self.submit(txt_path)
+
+    def wait(self) -> tuple:
+        """Wait for all submitted reports and return (done, failed) counts"""
+        done = failed = 0
+        for txt_path, future in self.futures.items():
+            try:
+                future.result()
+                done += 1
+            except Exception as e:
+                failed += 1
+                print(f"{Colors.WARNING}⚠ {os.path.basename(txt_path)}: {e}{Colors.ENDC}")
+        return done, failed
+
+def build_report_pools(offline_pdf: bool = False, table_format: Optional[str] = None,
+                       workers: Optional[int] = None) -> dict:
+    """Create the post-export pools requested on the command line"""
+    if not offline_pdf and not table_format:
+        return {}
+    from concurrent.futures import ProcessPoolExecutor
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pools = {}
+    if offline_pdf:
+        pools["pdf"] = ReportPool(executor, render_text_pdf, pdf_output_path,
+                                  "Rendered {done} PDF(s) offline")
+    if table_format:
+        pools["table"] = ReportPool(executor, partial(parse_report, fmt=table_format),
+                                    partial(table_output_path, fmt=table_format),
+                                    f"Parsed {{done}} report(s) into {TABLE_FOLDER}/*.{table_format}")
+    return pools
+
+def report_consumer(pools: list):
+    """on_export callback that hands each verified report to the given pools"""
+    if not pools:
+        return None
+
+    def on_export(scenario, output_file):
+        for pool in pools:
+            pool.submit(output_file)
+    return on_export
+
+def finish_report_pools(pools: dict):
+    """Wait for every post-export pool to drain and shut the workers down"""
+    start = time.time()
+    pending = sum(not future.done() for pool in pools.values() for future in pool.futures.values())
+    if pending:
+        print(f"\n{Colors.OKBLUE}Waiting for {pending} post-export task(s) to finish...{Colors.ENDC}")
+    for pool in pools.values():
+        done, failed = pool.wait()
+        status = Colors.OKGREEN if not failed else Colors.WARNING
+        print(f"{status}✓ {pool.summary.format(done=done)}"
+              f"{f', {failed} failed' if failed else ''} ({time.time() - start:.1f}s after export){Colors.ENDC}")
+    for executor in {pool.executor for pool in pools.values()}:
+        executor.shutdown()
+
+class AutomationAborted(Exception):
+    """The user stopped automation through the failsafe or Ctrl+C"""
+
+def automate_synchro_process(folder_path: str, num_scenarios: int, export_pdf: bool = False,
+                             export_timeout: Optional[float] = None, pipeline_depth: int = 0,
+                             backend: Optional[InputBackend] = None, timer: Optional["StepTimer"] = None,
+                             select_first: bool = False, profile: Optional[TimingProfile] = None,
+                             scenarios: Optional[list] = None, manifest: Optional["ExportManifest"] = None,
+                             raise_on_abort: bool = False, on_export=None,
+                             layout: Optional[ScreenLayout] = None, retries: int = 2,
+                             fingerprints: Optional[dict] = None, settle_time: float = 0.25):
     """Synchro report processing automation"""
-    pyautogui.PAUSE = 0.005  
-    pyautogui.FAILSAFE = True
+    backend = backend or PyAutoGUIBackend()
+    layout = layout or ScreenLayout()
+    timer = timer or StepTimer(clock=backend.now, backend_name=backend.name)
+    profile = profile or TimingProfile()
+    manifest = manifest or ExportManifest.load(folder_path)
+    plan = scenarios if scenarios is not None else list(range(1, num_scenarios + 1))
 
     tab_count = 10 if export_pdf else 6
-    final_sleep = 20 if export_pdf else 0.4
-    extra_sleep = 1 if export_pdf else 0
+    dialog_delay = "export_dialog_pdf" if export_pdf else "export_dialog"
+    extension = ".pdf" if export_pdf else ".txt"
+    if export_timeout is None:
+        export_timeout = 60 if export_pdf else 10
+
+    # Existing reports in dialog order - scenario N overwrites the Nth file
+    targets = report_targets(folder_path, extension)
+    target_owner = {name.lower(): number for number, name in enumerate(targets, 1)}
 
-    print(f"{Colors.WARNING}⚠ Failsafe enabled - move mouse to corner to emergency stop{Colors.ENDC}")
+    previous = None
+    export_delays = {}  # scenario -> delays its export used, credited once it is verified
+    failed = {}  # scenario -> reason, exported again at the end of the batch
+    verified = set()
+
+    def report_export(scenario, output_file):
+        nonlocal previous
+        expected = targets[scenario - 1] if scenario <= len(targets) else None
+        # Only another scenario's export counts as a duplicate, not this scenario's failed attempt
+        last = previous[1:] if previous and previous[0] != scenario else None
+        problem, sha256 = verify_export(output_file, scenario, expected, last, num_scenarios)
+        if problem is None:
+            emit("export", scenario=scenario, path=output_file, result="saved", detail="")
+            profile.record_success(export_delays.pop(scenario, set()))
+            manifest.record(scenario, output_file, sha256,
+                            fingerprints.get(scenario) if fingerprints else None)
+            failed.pop(scenario, None)
+            verified.add(scenario)
+            if on_export:
+                on_export(scenario, output_file)
+        else:
+            if output_file is None:
+                emit("export", scenario=scenario, path=None, result="missing",
+                     detail=f"no {extension} output detected within {export_timeout:.0f}s")
+            elif problem == "duplicate":
+                emit("export", scenario=scenario, path=output_file, result="duplicate",
+                     detail="overwrote the previous scenario's report")
+            else:
+                emit("export", scenario=scenario, path=output_file, result="mismatch", detail=problem)
+            profile.record_failure(export_delays.pop(scenario, set()))
+            failed[scenario] = problem
+            verified.discard(scenario)
+            manifest.forget([scenario])
+            # A report written over another scenario's file invalidates that export too
+            owner = target_owner.get(os.path.basename(output_file or "").lower())
+            if owner in verified and owner != scenario:
+                failed[owner] = f"overwritten by scenario {scenario}"
+                verified.discard(owner)
+                manifest.forget([owner])
+        if output_file:
+            previous = (scenario, output_file, sha256)
+
+    scheduler = ExportScheduler(folder_path, extension, export_timeout,
+                                depth=pipeline_depth, settle_time=settle_time, on_complete=report_export,
+                                clock=backend.now, sleep=backend.sleep)
+
+    emit("message", level="warning", text="⚠ Failsafe enabled - move mouse to corner to emergency stop")
+    if pipeline_depth:
+        emit("message", level="notice", text=f"⇉ Pipelined export - up to {pipeline_depth} report(s) in flight")
     
+    # Reports from earlier batches no longer count once this batch starts replacing them,
+    # so an interrupted run resumes from the scenarios it had not verified yet
+    manifest.forget(plan)
+
+    work = list(plan)
+    attempt = 0
     try:
-        for scenario in range(1, num_scenarios + 1):
+        # Retry passes are appended to the work list once the current pass has drained
+        for index, scenario in enumerate(work):
             start_time = time.time()
-            print(f"\n{Colors.BOLD}{Colors.HEADER}┌─ Processing Scenario {scenario}/{num_scenarios} ─┐{Colors.ENDC}")
+            emit("scenario_start", scenario=scenario, total=num_scenarios)
             
+            backend.configure(pause=profile.delay("pause"), failsafe=True)
             step = 1
-            total_steps = 8 if scenario == 1 else 9
+            # Scenario 1 is already active when a fresh batch starts
+            select_scenario = index > 0 or scenario > 1 or select_first
+            total_steps = 9 if select_scenario else 8
             
             # Scenario selection for subsequent scenarios
-            if scenario > 1:
-                print_status(step, "Selecting scenario...", "info")
-                pyautogui.click(-300, 110)
-                time.sleep(0.05)
+            if select_scenario:
+                with timer.step(scenario, "select_scenario"):
+                    print_status(step, "Selecting scenario...", "info")
+                    backend.click(*layout.menu)
+                    backend.sleep(profile.delay("select_menu"))
+                    print_progress_bar(step, total_steps)
+                    step += 1
+                    
+                    print_status(step, f"Selecting scenario {scenario}...", "info")
+                    if num_scenarios <= layout.visible_rows:
+                        backend.click(*layout.row(scenario))
+                    else:
+                        # A scrolling list may open scrolled to the current scenario, so
+                        # anchor on Home and move by keyboard instead of clicking a fixed row
+                        key_burst(backend, scenario_select_keys(scenario, layout.visible_rows - 1),
+                                  profile.delay("key_interval"))
+                    backend.sleep(profile.delay("select_row"))  
+                    print_progress_bar(step, total_steps)
+                    step += 1
+            
+            # Main automation sequence
+            with timer.step(scenario, "focus_interface"):
+                print_status(step, "Clicking Synchro interface...", "info")
+                backend.click(*layout.canvas)
+                backend.sleep(profile.delay("focus"))  
                 print_progress_bar(step, total_steps)
                 step += 1
-                
-                scenario_y = 160 + (25 * (scenario - 2))
-                print_status(step, f"Selecting scenario {scenario}...", "info")
-                pyautogui.click(-300, scenario_y)
-                time.sleep(0.05)  
+            
+            with timer.step(scenario, "open_report_menu"):
+                print_status(step, "Opening create report menu...", "info")
+                backend.hotkey('ctrl', 'r')
+                backend.sleep(profile.delay("report_menu"))  
                 print_progress_bar(step, total_steps)
                 step += 1
             
-            # Main automation sequence
-            print_status(step, "Clicking Synchro interface...", "info")
-            pyautogui.click(-1200, 700)
-            time.sleep(0.05)  
-            print_progress_bar(step, total_steps)
-            step += 1
-            
-            print_status(step, "Opening create report menu...", "info")
-            pyautogui.hotkey('ctrl', 'r')
-            time.sleep(0.05)  
-            print_progress_bar(step, total_steps)
-            step += 1
-            
-            print_status(step, "Navigating report interface...", "info")
-            key_burst(['tab'] * tab_count) 
-            print_progress_bar(step, total_steps)
-            step += 1
-            
-            print_status(step, "Opening export dialog...", "info")
-            pyautogui.press('enter')
-            time.sleep(0.8+extra_sleep)
-            print_progress_bar(step, total_steps)
-            step += 1
-            
-            # File handling
-            if scenario == 1:
-                print_status(step, "Setting output directory...", "info")
-                pyautogui.hotkey('ctrl', 'l')
-                time.sleep(0.02)  
-                pyautogui.write(folder_path)
-                pyautogui.press('enter')
-                time.sleep(0.4)  
+            with timer.step(scenario, "navigate_report"):
+                print_status(step, "Navigating report interface...", "info")
+                key_burst(backend, ['tab'] * tab_count, profile.delay("key_interval"))
                 print_progress_bar(step, total_steps)
                 step += 1
-                
-                print_status(step, "Navigating directory...", "info")
-                key_burst(['f6'] * 3)
-                key_burst(['down', 'up'])
+            
+            with timer.step(scenario, "open_export_dialog"):
+                print_status(step, "Opening export dialog...", "info")
+                backend.press('enter')
+                backend.sleep(profile.delay(dialog_delay))
                 print_progress_bar(step, total_steps)
                 step += 1
+            
+            # File handling
+            target_file = targets[scenario - 1] if scenario <= len(targets) else None
+            if index == 0:
+                with timer.step(scenario, "set_directory"):
+                    print_status(step, "Setting output directory...", "info")
+                    backend.hotkey('ctrl', 'l')
+                    backend.sleep(profile.delay("address_bar"))  
+                    backend.write(folder_path)
+                    backend.press('enter')
+                    backend.sleep(profile.delay("directory"))  
+                    print_progress_bar(step, total_steps)
+                    step += 1
                 
-            else:
-                print_status(step, f"Selecting file {scenario}...", "info")
-                pyautogui.hotkey('alt', 'd')
-                time.sleep(0.02)  
+                with timer.step(scenario, "select_file"):
+                    if target_file:
+                        print_status(step, f"Selecting {target_file}...", "info")
+                        select_file_by_name(backend, target_file, profile)
+                    else:
+                        print_status(step, "Navigating directory...", "info")
+                        rows = ['down', 'up'] if scenario == 1 else ['down'] * (scenario - 1)
+                        key_burst(backend, ['f6'] * 3 + rows, profile.delay("key_interval"))
+                    print_progress_bar(step, total_steps)
+                    step += 1
                 
-                key_burst(['f6'] * 3)
-                key_burst(['down'] * (scenario - 1))
-                print_progress_bar(step, total_steps)
-                step += 1
+            else:
+                with timer.step(scenario, "select_file"):
+                    if target_file:
+                        print_status(step, f"Selecting {target_file}...", "info")
+                        select_file_by_name(backend, target_file, profile)
+                    else:
+                        print_status(step, f"Selecting file {scenario}...", "info")
+                        backend.hotkey('alt', 'd')
+                        backend.sleep(profile.delay("address_bar"))  
+                        
+                        key_burst(backend, ['f6'] * 3 + ['down'] * (scenario - 1), profile.delay("key_interval"))
+                    print_progress_bar(step, total_steps)
+                    step += 1
             
-            print_status(step, f"{'Processing PDF export' if export_pdf else 'Processing .txt export'}...", "info")
-            pyautogui.press('enter')
-            time.sleep(0.15)
-            if export_pdf:
-                time.sleep(0.15)  
-                key_burst(['left'])
-                time.sleep(0.15)  
-            pyautogui.press('enter')
-            time.sleep(final_sleep)   
-            print_progress_bar(step, total_steps)
+            with timer.step(scenario, "export"):
+                print_status(step, f"{'Processing PDF export' if export_pdf else 'Processing .txt export'}...", "info")
+                before_export = scheduler.snapshot()
+                backend.press('enter')
+                backend.sleep(profile.delay("confirm"))
+                if export_pdf:
+                    backend.sleep(profile.delay("confirm"))  
+                    key_burst(backend, ['left'])
+                    backend.sleep(profile.delay("confirm"))  
+                backend.press('enter')
+                print_progress_bar(step, total_steps)
+                backend.after_export(folder_path, scenario, extension)
+
+            with timer.step(scenario, "export_wait"):
+                export_delays[scenario] = profile.take_used()
+                scheduler.submit(scenario, before_export)
             
             elapsed = time.time() - start_time
-            print(f"\n{Colors.OKGREEN}└─ Scenario {scenario} completed in {elapsed:.2f}s ─┘{Colors.ENDC}")
-        
+            emit("scenario_done", scenario=scenario, elapsed=elapsed)
+
+            if index < len(work) - 1:
+                continue
+            if scheduler.pending:
+                emit("message", level="info", gap=True,
+                     text=f"Waiting for {len(scheduler.pending)} export(s) to finish...")
+                with timer.step(None, "export_drain"):
+                    scheduler.drain()
+            if failed and attempt < retries:
+                attempt += 1
+                retry = sorted(failed)
+                backoff = RETRY_BACKOFF * 2 ** (attempt - 1)
+                emit("message", level="warning", gap=True,
+                     text=f"↻ Retrying scenario(s) {format_scenarios(retry)} in {backoff:.0f}s "
+                          f"(attempt {attempt}/{retries})")
+                with timer.step(None, "retry_backoff"):
+                    backend.sleep(backoff)
+                work.extend(retry)
+
+        if failed:
+            emit("message", level="error", gap=True,
+                 text=f"✗ {len(failed)} scenario(s) failed verification: "
+                      + "; ".join(f"{scenario}: {reason}" for scenario, reason in sorted(failed.items())))
+            return False
         return True  # Success
         
-    except pyautogui.FailSafeException:
-        print(f"\n{Colors.WARNING}╔══════════════════════════════════════════════════════════╗")
-        print(f"║  {Colors.BOLD}⚠ AUTOMATION STOPPED BY FAILSAFE{Colors.ENDC}{Colors.WARNING}                   ║")
-        print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}")
+    except backend.failsafe_exception:
+        emit("aborted", reason="failsafe")
+        if raise_on_abort:
+            raise AutomationAborted("failsafe")
         return False
     except KeyboardInterrupt:
-        print(f"\n{Colors.WARNING}╔══════════════════════════════════════════════════════════╗")
-        print(f"║  {Colors.BOLD}⚠ AUTOMATION CANCELLED BY USER{Colors.ENDC}{Colors.WARNING}                      ║")
-        print(f"║    User stopped process (Ctrl+C)                ║")
-        print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}")
+        emit("aborted", reason="cancelled")
+        if raise_on_abort:
+            raise AutomationAborted("cancelled")
         return False
     except Exception as e:
-        print(f"\n{Colors.FAIL}╔══════════════════════════════════════════════════════════╗")
-        print(f"║  {Colors.BOLD}✗ AUTOMATION ERROR{Colors.ENDC}{Colors.FAIL}                               ║")
-        print(f"║    Error: {str(e)[:45]:<45} ║")
-        print(f"╚══════════════════════════════════════════════════════════╝{Colors.ENDC}")
+        emit("aborted", reason="error", error=str(e))
         return False
 
+# Jobs need an output `folder` and scenario `count`, and may give a Synchro `project`,
+# `format` (txt or pdf), `name`, `only`, `resume`, `inputs` and `changed_only`;
+# relative paths are resolved against the job file's folder
+def load_jobs(path: str) -> list:
+    """Read a JSON or TOML job file into a list of validated jobs"""
+    base = Path(path).resolve().parent
+    with open(path, "rb") as handle:
+        raw = handle.read().decode("utf-8")
+
+    if path.lower().endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            raise ValueError("TOML job files need Python 3.11+ - use JSON instead")
+        data = tomllib.loads(raw)
+    else:
+        data = json.loads(raw)
+
+    entries = data.get("jobs", []) if isinstance(data, dict) else data
+    jobs = []
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or "folder" not in entry or "count" not in entry:
+            raise ValueError(f"job {number} needs at least 'folder' and 'count'")
+        export_format = str(entry.get("format", "txt")).lower().lstrip(".")
+        if export_format not in ("txt", "pdf"):
+            raise ValueError(f"job {number}: format must be 'txt' or 'pdf', not '{export_format}'")
+        only = entry.get("only")
+        if isinstance(only, list):
+            only = ",".join(str(value) for value in only)
+        project = str(base / entry["project"]) if entry.get("project") else None
+        inputs = str(base / entry["inputs"]) if entry.get("inputs") else None
+        folder = str(base / entry["folder"])
+        if only is not None:
+            try:
+                parse_scenario_spec(str(only), int(entry["count"]))
+            except ValueError as e:
+                raise ValueError(f"job {number}: only {e}")
+        if entry.get("changed_only") and not (project or inputs):
+            raise ValueError(f"job {number}: changed_only needs a 'project' or 'inputs' to fingerprint")
+        jobs.append({
+            "name": entry.get("name") or Path(project or folder).stem,
+            "project": project,
+            "folder": folder,
+            "count": int(entry["count"]),
+            "export_pdf": export_format == "pdf",
+            "only": only,
+            "resume": bool(entry.get("resume", False)),
+            "inputs": inputs,
+            "changed_only": bool(entry.get("changed_only", False)),
+        })
+    return jobs
+
+def open_project(backend: InputBackend, project_path: str, profile: TimingProfile):
+    """Open a project file in the running Synchro instance and confirm it is the active one"""
+    backend.hotkey('ctrl', 'o')
+    backend.sleep(profile.delay("open_dialog"))
+    backend.write(project_path)
+    backend.press('enter')
+    backend.sleep(profile.delay("project_load"))
+
+    # A missed path or a "save changes?" prompt leaves the previous project open
+    name = re.compile(rf"(?<!\w){re.escape(Path(project_path).stem)}(?!\w)", re.IGNORECASE)
+    deadline = backend.now() + profile.delay("project_load")
+    while True:
+        title = backend.active_window_title()
+        if title is not None and name.search(title):
+            return
+        if backend.now() >= deadline:
+            raise ValueError(f"{Path(project_path).name} did not open - active window is "
+                             f"'{title or 'unknown'}'")
+        backend.sleep(0.25)
+
+def job_pools(job: dict, pools: dict) -> list:
+    """Post-export pools that apply to a job's reports"""
+    selected = []
+    if job["export_pdf"] and "pdf" in pools:
+        selected.append(pools["pdf"])
+    if "table" in pools and (not job["export_pdf"] or "pdf" in pools):
+        selected.append(pools["table"])
+    return selected
+
+def run_job_queue(jobs: list, backend: InputBackend, profile: TimingProfile, args,
+                  pools: Optional[dict] = None, layout: Optional[ScreenLayout] = None) -> list:
+    """Process jobs one after another, isolating failures to the job that hit them"""
+    results = []
+    for number, job in enumerate(jobs, 1):
+        emit("message", level="header", gap=True, text=f"═══ Job {number}/{len(jobs)}: {job['name']} ═══")
+        start = time.time()
+        status = "failed"
+        verified = []
+        try:
+            if not validate_folder_path(job["folder"]):
+                raise ValueError(f"output folder '{job['folder']}' does not exist")
+            # PDF jobs export .txt through the GUI and render offline when a pool is given
+            pools = pools or {}
+            gui_pdf = job["export_pdf"] and "pdf" not in pools
+            consumer = report_consumer(job_pools(job, pools))
+
+            def on_export(scenario, output_file, consumer=consumer):
+                verified.append(scenario)
+                if consumer:
+                    consumer(scenario, output_file)
+
+            extension = ".pdf" if gui_pdf else ".txt"
+            if job["project"] and not os.path.isfile(job["project"]):
+                raise ValueError(f"project '{job['project']}' not found")
+            fingerprints = None
+            if job["project"] or job["inputs"]:
+                fingerprints = input_fingerprints(job["count"], job["project"], job["inputs"])
+            scenarios = plan_scenarios(job["folder"], job["count"], extension, job["only"], job["resume"],
+                                       fingerprints if job["changed_only"] else None)
+            if not scenarios:
+                status = "skipped"
+            else:
+                if job["project"]:
+                    print_status(0, f"Opening {os.path.basename(job['project'])}...", "info")
+                    try:
+                        open_project(backend, job["project"], profile)
+                    except backend.failsafe_exception:
+                        emit("aborted", reason="failsafe")
+                        raise AutomationAborted("failsafe")
+
+                timer = StepTimer(clock=backend.now, backend_name=backend.name)
+                success = automate_synchro_process(job["folder"], job["count"], gui_pdf,
+                                                   args.export_timeout, args.pipeline, backend=backend,
+                                                   timer=timer, select_first=True, profile=profile,
+                                                   scenarios=scenarios, raise_on_abort=True,
+                                                   on_export=on_export, layout=layout,
+                                                   retries=args.retries, fingerprints=fingerprints,
+                                                   settle_time=args.settle_time)
+                timer.write_log(os.path.join(job["folder"], "ezsynchro_runs.jsonl"))
+                status = "ok" if success else "failed"
+        except AutomationAborted:
+            results.append((job, "aborted", len(verified), time.time() - start))
+            emit("message", level="warning", text="⚠ Job queue stopped - remaining jobs not run")
+            break
+        except Exception as e:
+            emit("message", level="error", text=f"✗ Job {job['name']} failed: {e}")
+        results.append((job, status, len(verified), time.time() - start))
+    return results
+
+def print_job_summary(results: list, total_jobs: int):
+    """Per-job status and timing table for a queue run"""
+    colors = {"ok": Colors.OKGREEN, "skipped": Colors.OKCYAN, "failed": Colors.FAIL, "aborted": Colors.WARNING}
+    print(f"\n{Colors.OKCYAN}╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {Colors.BOLD}JOB QUEUE SUMMARY{Colors.ENDC}{Colors.OKCYAN}                                         ║")
+    print(f"╚════════════════════════════════════════════════════════════╝{Colors.ENDC}")
+    print(f"{Colors.BOLD}  {'Job':<30}{'Status':<10}{'Reports':>8}{'Time':>10}{Colors.ENDC}")
+    for job, status, exported, elapsed in results:
+        print(f"  {job['name'][:29]:<30}{colors[status]}{status:<10}{Colors.ENDC}{exported:>8}{elapsed:>9.1f}s")
+    not_run = total_jobs - len(results)
+    if not_run:
+        print(f"  {Colors.WARNING}{not_run} job(s) not run{Colors.ENDC}")
+
+def resolve_layout(backend: InputBackend, visible_rows: Optional[int] = None) -> ScreenLayout:
+    """Calibrated layout for this monitor setup, falling back to the defaults"""
+    layout = load_layout(backend)
+    if layout:
+        print(f"{Colors.OKGREEN}✓ Using calibrated screen layout{Colors.ENDC}")
+    else:
+        print(f"{Colors.WARNING}⚠ No calibration for this monitor setup - using default coordinates "
+              f"(run 'ezsynchro calibrate'){Colors.ENDC}")
+        layout = ScreenLayout()
+    if visible_rows:
+        layout.visible_rows = visible_rows
+    return layout
+
+def print_timing_profile(profile: TimingProfile, path: Path):
+    """Show the delays a speed-mode run finished with"""
+    print(f"\n{Colors.BOLD}Timing profile:{Colors.ENDC} {Colors.OKCYAN}{path}{Colors.ENDC}")
+    print(f"  {profile.successes} verified / {profile.failures} failed export(s) this run")
+    for name, value in profile.last_good.items():
+        default = DEFAULT_DELAYS[name]
+        change = f"{value / default:>4.0%} of default" if default else "default"
+        print(f"  {name:<20}{value * 1000:>9.1f} ms  ({change})")
+
+def seed_placeholder_reports(folder_path: str, num_scenarios: int, extension: str):
+    """Placeholder reports for the save dialog to overwrite, as in a real output folder"""
+    for scenario in range(1, num_scenarios + 1):
+        Path(folder_path, f"Scenario {scenario}{extension}").touch()
+
+def recorded_key_bursts(num_scenarios: int, export_pdf: bool = False) -> list:
+    """The key bursts a batch sends, recorded from a silent run against the fake backend"""
+    backend = FakeBackend()
+    extension = ".pdf" if export_pdf else ".txt"
+    with tempfile.TemporaryDirectory(prefix="ezsynchro-bench-keys-") as folder_path, \
+            open(os.devnull, "w", encoding="utf-8") as devnull:
+        seed_placeholder_reports(folder_path, num_scenarios, extension)
+        with console_renderer("quiet", devnull):
+            automate_synchro_process(folder_path, num_scenarios, export_pdf, backend=backend, retries=0)
+    return [event["args"] for event in backend.events if event["action"] == "press_keys"]
+
+def print_key_benchmark(num_scenarios: int, export_pdf: bool = False, pause: float = 0.005,
+                        interval: float = 0.0):
+    """Micro-benchmark keystroke throughput for a batch's key bursts"""
+    bursts = recorded_key_bursts(num_scenarios, export_pdf)
+    results = benchmark_key_injection(bursts, pause, interval)
+
+    print(f"\n{Colors.OKCYAN}╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {Colors.BOLD}KEY INJECTION BENCHMARK{Colors.ENDC}{Colors.OKCYAN}                                   ║")
+    print(f"╚════════════════════════════════════════════════════════════╝{Colors.ENDC}")
+    print(f"  {num_scenarios} scenario(s), PAUSE {pause * 1000:.1f} ms, key interval {interval * 1000:.1f} ms")
+    print(f"\n{Colors.BOLD}  {'Mode':<10}{'calls':>8}{'keys':>8}{'simulated':>12}{'wall':>12}{'keys/s':>12}{Colors.ENDC}")
+    for label, result in results.items():
+        print(f"  {label:<10}{result['calls']:>8}{result['keystrokes']:>8}"
+              f"{result['simulated_time']:>11.3f}s{result['wall']:>11.3f}s{result['keys_per_second']:>12.0f}")
+    speedup = results["per-key"]["wall"] / max(results["batched"]["wall"], 1e-9)
+    print(f"\n  {Colors.OKGREEN}Batched injection is {speedup:.1f}x faster "
+          f"(wall time through PyAutoGUIBackend, key events stubbed){Colors.ENDC}")
+
+def run_dry_run(num_scenarios: int, export_pdf: bool = False, export_timeout: Optional[float] = None,
+                pipeline_depth: int = 0, render_time: float = 0.0, runs: int = 1,
+                run_log: Optional[str] = None, profile: Optional[TimingProfile] = None,
+                scenarios: Optional[list] = None, events: str = "console", event_stream=None,
+                retries: int = 2, settle_time: float = 0.25) -> bool:
+    """Run the full scenario plan against the fake backend and report tool overhead"""
+    backend = FakeBackend(render_time=render_time)
+    timer = StepTimer(clock=backend.now, backend_name=backend.name)
+    success = True
+
+    with tempfile.TemporaryDirectory(prefix="ezsynchro-dry-run-") as folder_path:
+        seed_placeholder_reports(folder_path, num_scenarios, ".pdf" if export_pdf else ".txt")
+
+        wall_start = time.perf_counter()
+        with console_renderer(events, event_stream):
+            for run in range(runs):
+                timer.run = run
+                success = automate_synchro_process(folder_path, num_scenarios, export_pdf,
+                                                   export_timeout, pipeline_depth, backend=backend,
+                                                   timer=timer, select_first=run > 0,
+                                                   profile=profile, scenarios=scenarios,
+                                                   retries=retries, settle_time=settle_time) and success
+            wall_elapsed = time.perf_counter() - wall_start
+
+    if run_log:
+        timer.write_log(run_log)
+    if runs > 1:
+        print_bench_report(timer.records)
+
+    summary = backend.summary()
+    planned = len(scenarios) if scenarios is not None else num_scenarios
+    actions = ", ".join(f"{name}={count}" for name, count in sorted(summary["actions"].items()))
+
+    print(f"\n{Colors.OKCYAN}╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {Colors.BOLD}DRY RUN SUMMARY{Colors.ENDC}{Colors.OKCYAN}                                           ║")
+    print(f"╚════════════════════════════════════════════════════════════╝{Colors.ENDC}")
+    print(f"  Scenarios:        {Colors.OKCYAN}{planned}{Colors.ENDC}")
+    print(f"  Inputs sent:      {Colors.OKCYAN}{summary['inputs']}{Colors.ENDC} ({actions})")
+    print(f"  Sleep time:       {Colors.OKCYAN}{summary['sleep_time']:.3f}s{Colors.ENDC} (simulated)")
+    print(f"  PAUSE overhead:   {Colors.OKCYAN}{summary['pause_time']:.3f}s{Colors.ENDC} (simulated)")
+    print(f"  Batch time:       {Colors.OKCYAN}{summary['simulated_time']:.3f}s{Colors.ENDC} (simulated)")
+    print(f"  Tool overhead:    {Colors.OKCYAN}{wall_elapsed:.3f}s{Colors.ENDC} "
+          f"({wall_elapsed / (num_scenarios * runs) * 1000:.1f} ms/scenario wall clock)")
+    return success
+
+def parse_command(argv: list) -> int:
+    """`ezsynchro parse`: tabulate the .txt reports already in a folder"""
+    parser = argparse.ArgumentParser(prog="ezsynchro parse",
+                                     description="Parse exported Synchro .txt reports into tables")
+    parser.add_argument("folder", help="Folder containing exported .txt reports")
+    parser.add_argument("--format", "-f", choices=["csv", "parquet"], default="csv",
+                        help="Table format (default: csv)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if not validate_folder_path(args.folder):
+        print(f"{Colors.FAIL}✗ Folder '{args.folder}' does not exist{Colors.ENDC}")
+        return 1
+
+    pools = build_report_pools(table_format=args.format, workers=args.workers)
+    for txt_path in snapshot_outputs(args.folder, ".txt"):
+        pools["table"].submit(txt_path)
+    finish_report_pools(pools)
+    return 0
+
+def resolve_report(ref: str, index: ReportIndex, folder: Optional[str]) -> tuple:
+    """Turn a compare argument into (label, rows)"""
+    if ref.startswith("@"):
+        digest = index.resolve_hash(ref[1:])
+        rows = index.load(digest) if digest else None
+        if rows is None:
+            raise ValueError(f"no unique indexed report matches {ref}")
+        return ref, rows
+
+    # A report path, or a scenario number or report name inside --folder
+    candidates = [ref]
+    if folder:
+        candidates.append(os.path.join(folder, ref))
+        candidates.append(os.path.join(folder, ref + ".txt"))
+        if ref.isdigit():
+            entry = ExportManifest.load(folder).entries.get(ref)
+            if entry:
+                candidates.append(os.path.join(folder, os.path.splitext(entry["path"])[0] + ".txt"))
+            targets = report_targets(folder, ".txt")
+            if 0 < int(ref) <= len(targets):
+                candidates.append(os.path.join(folder, targets[int(ref) - 1]))
+    for path in candidates:
+        if os.path.isfile(path):
+            return Path(path).stem, index.rows(path)
+    raise ValueError(f"report '{ref}' not found")
+
+def compare_command(argv: list) -> int:
+    """`ezsynchro compare`: per-movement deltas between scenarios"""
+    parser = argparse.ArgumentParser(prog="ezsynchro compare",
+                                     description="Compare parsed metrics between exported reports")
+    parser.add_argument("reports", nargs="*",
+                        help="Base report then one or more reports to compare: a path, a scenario "
+                             "number or name in --folder, or @<hash> from --list")
+    parser.add_argument("--folder", "-f", default=None, help="Output folder to resolve scenarios in")
+    parser.add_argument("--metric", "-m", action="append", default=None,
+                        help="Only metrics containing this text, e.g. -m delay -m LOS (repeatable)")
+    parser.add_argument("--intersection", "-i", default=None, help="Only intersections containing this text")
+    parser.add_argument("--all", action="store_true", help="Include unchanged values")
+    parser.add_argument("--list", action="store_true", help="List indexed reports and their hashes")
+    parser.add_argument("--index", default=None, help=f"Index location (default: {default_index_path()})")
+    args = parser.parse_args(argv)
+
+    index = ReportIndex(args.index)
+    if args.list:
+        print(f"{Colors.BOLD}{'Hash':<14}{'Indexed':<21}Report{Colors.ENDC}")
+        for path, entry in sorted(index.catalog.items()):
+            for item in entry["history"]:
+                print(f"@{item['sha256'][:12]:<13}{item['indexed_at']:<21}{path}")
+        return 0
+    if len(args.reports) < 2:
+        parser.error("need a base report and at least one report to compare")
+
+    start = time.perf_counter()
+    try:
+        base_label, base_rows = resolve_report(args.reports[0], index, args.folder)
+        others = [resolve_report(ref, index, args.folder) for ref in args.reports[1:]]
+    except (OSError, ValueError) as e:
+        print(f"{Colors.FAIL}✗ {e}{Colors.ENDC}")
+        return 1
+    finally:
+        index.save()
+
+    for label, rows in others:
+        deltas = compare_rows(base_rows, rows, args.metric, args.intersection, args.all)
+        print(f"\n{Colors.BOLD}{Colors.OKCYAN}{base_label} → {label}{Colors.ENDC} "
+              f"({len(deltas)} {'row(s)' if args.all else 'difference(s)'})")
+        if not deltas:
+            continue
+        print(f"{Colors.BOLD}  {'Intersection':<28}{'Mvmt':<7}{'Metric':<26}{'Base':>9}{'Compare':>9}{'Δ':>9}{Colors.ENDC}")
+        current = current_section = None
+        for section, name, movement, metric, before, after, change in deltas:
+            if section != current_section:
+                print(f"  {Colors.OKBLUE}{section or '(untitled)'}{Colors.ENDC}")
+                current_section, current = section, None
+            shown = name[:27] if name != current else ""
+            current = name
+            color = Colors.ENDC if change in ("=", "+0.00") else Colors.WARNING
+            print(f"  {shown:<28}{movement[:6]:<7}{metric[:25]:<26}{before:>9}{after:>9}"
+                  f"{color}{change:>9}{Colors.ENDC}")
+    print(f"\n{Colors.OKGREEN}✓ Compared in {(time.perf_counter() - start) * 1000:.1f} ms{Colors.ENDC}")
+    return 0
+
+def calibrate_command(argv: list) -> int:
+    """`ezsynchro calibrate`: locate Synchro's UI once and cache the coordinates"""
+    parser = argparse.ArgumentParser(
+        prog="ezsynchro calibrate",
+        description="Find Synchro's scenario menu, canvas and scenario rows on screen and cache "
+                    "their coordinates for the current monitor setup",
+        epilog=f"Templates are small PNG crops named {', '.join(n + '.png' for n in CALIBRATION_TEMPLATES)}: "
+               "the scenario menu, any empty spot on the network canvas, and the first row of the "
+               f"open scenario menu. An optional {PITCH_TEMPLATE}.png crop of the second row is used "
+               "to measure the spacing between rows."
+    )
+    parser.add_argument("--templates", default=str(default_templates_path()),
+                        help="Folder containing the template images (default: %(default)s)")
+    parser.add_argument("--row-pitch", type=int, default=None,
+                        help=f"Pixels between scenario rows in the menu (default: measured from "
+                             f"{PITCH_TEMPLATE}.png, else {DEFAULT_ROW_PITCH} scaled by DPI/96)")
+    parser.add_argument("--visible-rows", type=int, default=VISIBLE_SCENARIO_ROWS,
+                        help="Scenario rows the open menu shows before it scrolls; PageDown jumps are "
+                             f"sized from it (default: {VISIBLE_SCENARIO_ROWS})")
+    parser.add_argument("--show", action="store_true",
+                        help="Show the cached layout for the current monitor setup and exit")
+    args = parser.parse_args(argv)
+
+    backend = live_backend()
+    key = geometry_key(backend.screen_geometry())
+    if args.show:
+        layout = load_layout(backend)
+        print(f"Monitor setup: {Colors.OKCYAN}{key}{Colors.ENDC}")
+        if layout is None:
+            print(f"{Colors.WARNING}⚠ Not calibrated - default coordinates will be used{Colors.ENDC}")
+            layout = ScreenLayout()
+        for name, value in layout.to_dict().items():
+            print(f"  {name:<12}{value}")
+        return 0
+
+    from PIL import Image
+    templates = {}
+    for name in CALIBRATION_TEMPLATES:
+        path = Path(args.templates) / f"{name}.png"
+        if not path.exists():
+            print(f"{Colors.FAIL}✗ Missing template {path}{Colors.ENDC}")
+            return 1
+        templates[name] = Image.open(path)
+    pitch_path = Path(args.templates) / f"{PITCH_TEMPLATE}.png"
+    if pitch_path.exists() and args.row_pitch is None:
+        templates[PITCH_TEMPLATE] = Image.open(pitch_path)
+
+    print(f"{Colors.WARNING}Bring Synchro to the front with its scenario menu visible.{Colors.ENDC}")
+    countdown(3, "Calibrating")
+    try:
+        layout = calibrate_layout(backend, templates, args.row_pitch, visible_rows=args.visible_rows)
+    except ValueError as e:
+        print(f"{Colors.FAIL}✗ Calibration failed: {e}{Colors.ENDC}")
+        return 1
+
+    save_layout(backend, layout)
+    print(f"{Colors.OKGREEN}✓ Layout cached for {key}{Colors.ENDC}")
+    for name, value in layout.to_dict().items():
+        print(f"  {name:<12}{value}")
+    return 0
+
+# Modules that must stay out of non-automation startup
+GUI_MODULES = ("pyautogui", "pyscreeze", "PIL", "pymsgbox", "pytweening", "mouseinfo")
+
+def measure_import_time() -> tuple:
+    """Cumulative import time of this module in microseconds, and the modules it loaded"""
+    script_dir = str(Path(__file__).resolve().parent)
+    module = Path(__file__).stem
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"import sys; sys.path.insert(0, {script_dir!r}); import {module}"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "import failed")
+
+    total = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in re.split(r"[:|]", line, maxsplit=3))
+        modules[name.strip()] = int(cumulative_us)
+        if name.strip() == module:
+            total = int(cumulative_us)
+    return total, modules
+
+def startup_command(argv: list) -> int:
+    """`ezsynchro startup`: check import time of the non-GUI entry points"""
+    parser = argparse.ArgumentParser(prog="ezsynchro startup",
+                                     description="Measure startup cost with -X importtime and enforce a budget")
+    parser.add_argument("--budget", type=float, default=150.0,
+                        help="Maximum median import time in milliseconds (default: 150)")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements to take (default: 5)")
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list (default: 8)")
+    args = parser.parse_args(argv)
+
+    samples = []
+    modules = {}
+    for _ in range(max(1, args.repeat)):
+        total, modules = measure_import_time()
+        samples.append(total / 1000)
+    median = percentile(samples, 50)
+
+    print(f"{Colors.BOLD}Import time:{Colors.ENDC} median {median:.1f} ms, "
+          f"min {min(samples):.1f} ms over {len(samples)} run(s) (budget {args.budget:.0f} ms)")
+    print(f"\n{Colors.BOLD}  {'Module':<40}{'cumulative':>12}{Colors.ENDC}")
+    for name, cumulative_us in sorted(modules.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name[:39]:<40}{cumulative_us / 1000:>10.1f}ms")
+
+    loaded = sorted(name for name in modules if name.split(".")[0] in GUI_MODULES)
+    ok = median <= args.budget and not loaded
+    if loaded:
+        print(f"\n{Colors.FAIL}✗ GUI modules imported at startup: {', '.join(loaded)}{Colors.ENDC}")
+    if median > args.budget:
+        print(f"\n{Colors.FAIL}✗ Startup over budget by {median - args.budget:.1f} ms{Colors.ENDC}")
+    if ok:
+        print(f"\n{Colors.OKGREEN}✓ Startup within budget, no GUI stack loaded{Colors.ENDC}")
+    return 0 if ok else 1
+
+COMMANDS = {
+    "parse": parse_command,
+    "compare": compare_command,
+    "calibrate": calibrate_command,
+    "startup": startup_command,
+}
+
 def main():
     """Main CLI interface"""
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(COMMANDS[sys.argv[1]](sys.argv[2:]))
+
     parser = argparse.ArgumentParser(
         description="EZSynchro - Automated Synchro Report Generator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -305,6 +2336,21 @@ def main():
   ezsynchro --path ./reports --count 5 --open # Open folder when done
   ezsynchro --peed                           # High speed mode
   ezsynchro --pdf                             # Expor as .pdf
+  ezsynchro --pdf --pipeline                  # Overlap PDF rendering with navigation
+  ezsynchro --offline-pdf                     # .txt via Synchro, PDFs rendered in parallel
+  ezsynchro --parse                           # Tabulate LOS/delay/v/c/queues while exporting
+  ezsynchro parse ./reports --format parquet  # Tabulate reports already on disk
+  ezsynchro compare -f ./reports 1 2 -m delay # Per-movement deltas between scenarios
+  ezsynchro calibrate                         # Locate Synchro on screen for this monitor setup
+  ezsynchro startup --budget 150              # Check non-GUI startup stays fast
+  ezsynchro --path ./reports --count 16 --resume    # Continue an interrupted batch
+  ezsynchro --path ./reports --count 16 --only 5,9-12   # Re-export selected scenarios
+  ezsynchro -p ./reports -c 16 --project model.syn --inputs "data/scn{{n}}_*.csv" --changed-only
+                                              # Re-export only scenarios whose inputs changed
+  ezsynchro --jobs submittal.json             # Export many projects in one pass
+  ezsynchro --dry-run --count 16              # Simulate the plan without touching the desktop
+  ezsynchro --path ./reports --count 5 --bench 3   # Time every step over 3 runs
+  ezsynchro --jobs submittal.json --json-events > events.jsonl   # Machine-readable progress
   
 Safety Features:
   • Move mouse to any corner to emergency stop
@@ -351,16 +2397,230 @@ Safety Features:
     action="store_true",
     help="Export as .pdf instead of .txt (longer processing time)"
     )
+
+    parser.add_argument(
+        "--offline-pdf",
+        action="store_true",
+        help="Export fast .txt reports and render the PDFs in parallel on a process pool"
+    )
+
+    parser.add_argument(
+        "--parse",
+        nargs="?",
+        const="csv",
+        choices=["csv", "parquet"],
+        default=None,
+        help=f"Parse each exported .txt report into {TABLE_FOLDER}/<report>.csv (or .parquet) as it lands"
+    )
+
+    parser.add_argument(
+        "--pipeline",
+        type=int,
+        nargs="?",
+        const=1,
+        default=0,
+        metavar="DEPTH",
+        help="Start the next scenario while up to DEPTH exports are still being written (default: 1)"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        default=None,
+        metavar="FILE",
+        help="Process every project in a JSON/TOML job file in one unattended pass"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Skip scenarios whose export in {MANIFEST_NAME} is still valid"
+    )
+
+    parser.add_argument(
+        "--project",
+        default=None,
+        metavar="FILE",
+        help=f"Saved Synchro project the reports come from - fingerprinted into {MANIFEST_NAME}"
+    )
+
+    parser.add_argument(
+        "--inputs",
+        default=None,
+        metavar="PATTERN",
+        help="Per-scenario input files to fingerprint, with {n} for the scenario, e.g. data/scn{n}_*.csv"
+    )
+
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Export only scenarios whose --project/--inputs changed since their last export"
+    )
+
+    parser.add_argument(
+        "--only",
+        default=None,
+        metavar="LIST",
+        help="Export only these scenarios, e.g. 5,9-12"
+    )
+
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        metavar="N",
+        help="Re-export scenarios that fail verification up to N more times at the end of the batch (default: 2)"
+    )
+
+    parser.add_argument(
+        "--export-timeout",
+        type=float,
+        help="Seconds to wait for each report file to finish writing (default: 60 for .pdf, 10 for .txt)",
+        default=None
+    )
+    
+    parser.add_argument(
+        "--visible-rows",
+        type=int,
+        default=None,
+        metavar="N",
+        help=f"Scenario rows the open menu shows before scrolling; larger batches select rows with "
+             f"Home/PageDown sized from it (default: calibrated, else {VISIBLE_SCENARIO_ROWS})"
+    )
+
+    parser.add_argument(
+        "--settle-time",
+        type=float,
+        default=0.25,
+        metavar="SECONDS",
+        help="How long a report must stop growing before it counts as written (default: 0.25); "
+             "PDFs also need their %%%%EOF trailer"
+    )
+
+    parser.add_argument(
+        "--bench",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Repeat the batch N times and print p50/p95/max latency per step and scenario"
+    )
+
+    parser.add_argument(
+        "--run-log",
+        default=None,
+        help="Append per-step timings to this .jsonl or .csv file "
+             "(default: ezsynchro_runs.jsonl in the output folder)"
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Run the scenario plan against a recording fake input driver and report timing"
+    )
+
+    parser.add_argument(
+        "--bench-keys",
+        action="store_true",
+        help="Micro-benchmark per-key versus batched keystroke injection (no input is sent)"
+    )
+
+    parser.add_argument(
+        "--render-time",
+        type=float,
+        default=0.0,
+        help="Simulated seconds Synchro takes to write each report in --dry-run mode"
+    )
+    
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Only report warnings, failed exports and errors while automating"
+    )
+
+    output.add_argument(
+        "--json-events",
+        action="store_true",
+        help="Write automation events to stdout as JSON lines (other output goes to stderr)"
+    )
     
     args = parser.parse_args()
+    if args.bench < 1:
+        parser.error("--bench needs at least 1 run")
+
+    # Automation events are drawn off the input thread; JSON mode keeps stdout machine-readable
+    events = "json" if args.json_events else "quiet" if args.quiet else "console"
+    event_stream = sys.stdout
+    if args.json_events:
+        sys.stdout = sys.stderr
+        args.no_banner = True
+
+    # Speed mode learns per-machine delays, otherwise the stock timings are used
+    profile_path = default_profile_path()
+    if args.speed:
+        profile = TimingProfile.load(profile_path, adaptive=True)
+    else:
+        profile = TimingProfile()
+
+    if args.bench_keys:
+        print_key_benchmark(args.count or 16, args.pdf, profile.delay("pause"), profile.delay("key_interval"))
+        sys.exit(0)
+
+    if args.dry_run:
+        num_scenarios = args.count or 16
+        try:
+            scenarios = parse_scenario_spec(args.only, num_scenarios) if args.only is not None else None
+        except ValueError as e:
+            print(f"{Colors.FAIL}✗ Invalid --only selection: {e}{Colors.ENDC}")
+            sys.exit(1)
+        success = run_dry_run(num_scenarios, args.pdf, args.export_timeout, args.pipeline,
+                              args.render_time, args.bench, args.run_log, profile, scenarios,
+                              events, event_stream, args.retries, args.settle_time)
+        if args.speed:
+            print_timing_profile(profile, Path("(dry run - not saved)"))
+        sys.exit(0 if success else 1)
     
     # Apply high speed mode
     if args.speed:
         print(f"{Colors.WARNING}🚀 HIGH SPEED MODE ENABLED{Colors.ENDC}")
+        print(f"{Colors.OKCYAN}  Adaptive timings from {profile_path}{Colors.ENDC}")
     
     try:
         if not args.no_banner:
             print_banner()
+
+        if args.jobs:
+            try:
+                jobs = load_jobs(args.jobs)
+            except (OSError, ValueError) as e:
+                print(f"\n{Colors.FAIL}✗ Could not read job file: {e}{Colors.ENDC}")
+                sys.exit(1)
+
+            print(f"\n{Colors.OKGREEN}✓ Loaded {len(jobs)} job(s) from {args.jobs}{Colors.ENDC}")
+            for number, job in enumerate(jobs, 1):
+                print(f"  {number:>2}. {Colors.OKCYAN}{job['name']}{Colors.ENDC} - {job['count']} scenario(s) "
+                      f"as {'.pdf' if job['export_pdf'] else '.txt'} → {job['folder']}")
+            print(f"\n{Colors.WARNING}Ensure Synchro application is visible and accessible.{Colors.ENDC}")
+            input(f"\n{Colors.BOLD}Press ENTER to begin or Ctrl+C to cancel...{Colors.ENDC}")
+
+            start_total = time.time()
+            pools = build_report_pools(args.offline_pdf, args.parse)
+            backend = live_backend()
+            layout = resolve_layout(backend, args.visible_rows)
+            with console_renderer(events, event_stream):
+                results = run_job_queue(jobs, backend, profile, args, pools, layout)
+            if pools:
+                for job, status, _, _ in results:
+                    if status == "ok":
+                        for pool in job_pools(job, pools):
+                            pool.sweep(job["folder"])
+                finish_report_pools(pools)
+            print_job_summary(results, len(jobs))
+            print(f"\n  Total time: {Colors.OKCYAN}{time.time() - start_total:.1f}s{Colors.ENDC}")
+            if args.speed:
+                profile.save(profile_path)
+                print_timing_profile(profile, profile_path)
+            all_ok = len(results) == len(jobs) and all(status in ("ok", "skipped") for _, status, _, _ in results)
+            sys.exit(0 if all_ok else 1)
         
         # Get inputs (either from args or interactive)
         if args.path and args.count:
@@ -384,6 +2644,43 @@ Safety Features:
                 print(f"  Mode: {Colors.WARNING}🚀 HIGH SPEED 🚀{Colors.ENDC}")
         else:
             folder_path, num_scenarios, open_folder_after, export_pdf = get_user_inputs()
+
+        # Offline PDF mode keeps the GUI on the fast .txt export path
+        table_format = args.parse
+        if args.offline_pdf:
+            export_pdf = False
+            print(f"\n{Colors.OKCYAN}⚙ Exporting .txt and rendering PDFs offline{Colors.ENDC}")
+        if table_format and export_pdf:
+            print(f"\n{Colors.WARNING}⚠ --parse needs .txt reports - skipped for GUI PDF export{Colors.ENDC}")
+            table_format = None
+
+        # Fingerprint the model inputs so the manifest can tell which scenarios went stale
+        fingerprints = None
+        if args.changed_only and not (args.project or args.inputs):
+            print(f"\n{Colors.FAIL}✗ --changed-only needs --project and/or --inputs to fingerprint{Colors.ENDC}")
+            sys.exit(1)
+        if args.project or args.inputs:
+            try:
+                fingerprints = input_fingerprints(num_scenarios, args.project, args.inputs)
+            except (OSError, ValueError) as e:
+                print(f"\n{Colors.FAIL}✗ Could not fingerprint inputs: {e}{Colors.ENDC}")
+                sys.exit(1)
+
+        # Narrow the batch to --only and, with --resume or --changed-only, to stale scenarios
+        extension = ".pdf" if export_pdf else ".txt"
+        try:
+            scenarios = plan_scenarios(folder_path, num_scenarios, extension, args.only, args.resume,
+                                       fingerprints if args.changed_only else None)
+        except ValueError as e:
+            print(f"\n{Colors.FAIL}✗ Invalid --only selection: {e}{Colors.ENDC}")
+            sys.exit(1)
+        if len(scenarios) < num_scenarios:
+            skipped = num_scenarios - len(scenarios)
+            print(f"\n{Colors.OKCYAN}↻ Skipping {skipped} scenario(s); "
+                  f"{len(scenarios)} to export: {format_scenarios(scenarios)}{Colors.ENDC}")
+        if not scenarios:
+            print(f"{Colors.OKGREEN}✓ All scenarios already exported - nothing to do{Colors.ENDC}")
+            sys.exit(0)
         
         print(f"\n{Colors.BOLD}Ready to start automation.{Colors.ENDC}")
         print(f"{Colors.WARNING}Ensure Synchro application is visible and accessible.{Colors.ENDC}")
@@ -393,15 +2690,52 @@ Safety Features:
             print(f"{Colors.OKGREEN}🚀 Starting automation process... 🚀{Colors.ENDC}")
             
             start_total = time.time()
-            success = automate_synchro_process(folder_path, num_scenarios, export_pdf)
+            pools = build_report_pools(args.offline_pdf, table_format)
+            backend = live_backend()
+            layout = resolve_layout(backend, args.visible_rows)
+            timer = StepTimer(clock=backend.now, backend_name=backend.name)
+            success = True
+            with console_renderer(events, event_stream):
+                for run in range(args.bench):
+                    if args.bench > 1:
+                        emit("message", level="header", gap=True,
+                             text=f"═══ Benchmark run {run + 1}/{args.bench} ═══")
+                    timer.run = run
+                    success = automate_synchro_process(folder_path, num_scenarios, export_pdf,
+                                                       args.export_timeout, args.pipeline, backend=backend,
+                                                       timer=timer, select_first=run > 0,
+                                                       profile=profile, scenarios=scenarios,
+                                                       on_export=report_consumer(list(pools.values())),
+                                                       layout=layout, retries=args.retries,
+                                                       fingerprints=fingerprints,
+                                                       settle_time=args.settle_time)
+                    if not success:
+                        break
+            if not success:
+                print(f"{Colors.OKCYAN}  Completed scenarios are recorded in {MANIFEST_NAME} - "
+                      f"rerun with --resume to continue{Colors.ENDC}")
             total_elapsed = time.time() - start_total
+
+            if args.speed:
+                profile.save(profile_path)
+                print_timing_profile(profile, profile_path)
+
+            timer.write_log(args.run_log or os.path.join(folder_path, "ezsynchro_runs.jsonl"))
+            if pools:
+                if success:
+                    for pool in pools.values():
+                        pool.sweep(folder_path)
+                finish_report_pools(pools)
+                total_elapsed = time.time() - start_total
+            if args.bench > 1:
+                print_bench_report(timer.records)
             
             if success:
                 #  success message
                 #scenarios_per_second = num_scenarios / total_elapsed
                 print(f"\n{Colors.OKGREEN}╔════════════════════════════════════════════════════════════╗")
                 print(f"║  {Colors.BOLD}🚀 AUTOMATION COMPLETED SUCCESSFULLY 🚀{Colors.ENDC}{Colors.OKGREEN}                ║")
-                print(f"║    Generated {num_scenarios} report(s) in {total_elapsed:.1f} seconds                    ║")
+                print(f"║    Generated {len(scenarios)} report(s) in {total_elapsed:.1f} seconds                    ║")
                 print(f"║    Output: {folder_path[:35]:<35}             ║")
                 print(f"╚════════════════════════════════════════════════════════════╝{Colors.ENDC}")
                 
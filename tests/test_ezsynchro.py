@@ -0,0 +1,305 @@
+"""Tests for EZSynchro against the fake backend - no desktop or Synchro needed"""
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+import EZSynchro as ez
+
+SAMPLE_REPORT = """\
+Lanes, Volumes, Timings
+3: Main St & Oak Ave\tTiming Plan: AM Peak
+
+Lane Group\tEBL\tEBT
+Traffic Volume (vph)\t10\t200
+95th %ile Queue (ft)\t#240\t95m
+Intersection Summary
+Cycle Length: 90
+Intersection Signal Delay: 12.3\tIntersection LOS: B
+Splits and Phases:  3: Main St & Oak Ave
+Ø1\tØ2
+12 s\t40 s
+
+Scenario 1 AM Existing\t\tSynchro 11 Report
+"""
+
+
+class FlakyBackend(ez.FakeBackend):
+    """Fake backend whose first export of some scenarios goes wrong"""
+
+    def __init__(self, misses=None, wrong_content=None, **kwargs):
+        super().__init__(**kwargs)
+        self.misses = dict(misses or {})  # scenario -> exports that write nothing
+        self.wrong_content = dict(wrong_content or {})  # scenario -> text of its first, bad export
+
+    def after_export(self, folder_path, scenario, extension):
+        if self.misses.get(scenario):
+            self.misses[scenario] -= 1
+            self._file_name = None
+            return
+        if scenario in self.wrong_content:
+            path = os.path.join(folder_path, self._file_name)
+            self._file_name = None
+            self._scheduled.append((self.clock, path, self.wrong_content.pop(scenario)))
+            self._flush_exports()
+            return
+        super().after_export(folder_path, scenario, extension)
+
+
+class AbortingBackend(ez.FakeBackend):
+    """Fake backend that is cancelled while exporting one scenario"""
+
+    def __init__(self, abort_at):
+        super().__init__()
+        self.abort_at = abort_at
+
+    def after_export(self, folder_path, scenario, extension):
+        if scenario == self.abort_at:
+            raise KeyboardInterrupt
+        super().after_export(folder_path, scenario, extension)
+
+
+@pytest.fixture
+def folder(tmp_path):
+    ez.seed_placeholder_reports(str(tmp_path), 4, ".txt")
+    return str(tmp_path)
+
+
+def run_batch(folder_path, num_scenarios=4, backend=None, **kwargs):
+    backend = backend or ez.FakeBackend()
+    timer = ez.StepTimer(clock=backend.now, backend_name=backend.name)
+    ok = ez.automate_synchro_process(folder_path, num_scenarios, backend=backend, timer=timer, **kwargs)
+    return ok, backend, timer
+
+
+# Dry-run plan
+
+def test_dry_run_plan_input_and_step_counts(folder):
+    ok, backend, timer = run_batch(folder)
+    summary = backend.summary()
+
+    assert ok
+    # Scenario 1 is already selected and also sets the output directory; later
+    # scenarios click the menu and row instead
+    assert summary["inputs"] == 11 + 10 * 3
+    assert summary["actions"]["hotkey"] == 1 + 4 * 2  # ctrl+l once, ctrl+r and alt+n per scenario
+    assert summary["pause_time"] == pytest.approx(summary["inputs"] * ez.DEFAULT_DELAYS["pause"])
+    assert summary["simulated_time"] == pytest.approx(summary["sleep_time"] + summary["pause_time"])
+
+    steps = {}
+    for record in timer.records:
+        steps.setdefault(record["scenario"], []).append(record["step"])
+    assert len(steps[1]) == 8 and "select_scenario" not in steps[1]
+    for scenario in (2, 3, 4):
+        assert len(steps[scenario]) == 8 and steps[scenario][0] == "select_scenario"
+
+
+def test_dry_run_reports_planned_scenarios(capsys):
+    assert ez.run_dry_run(6, scenarios=[2, 5], events="quiet")
+    output = capsys.readouterr().out
+    assert re.search(r"Scenarios:\s+\S*2\b", output)
+    # Scenario 2 is not the active one, so it is selected as well as setting the directory
+    assert re.search(r"Inputs sent:\s+\S*23\b", output)
+
+
+def test_empty_selection_exports_nothing(folder):
+    ok, backend, _ = run_batch(folder, scenarios=[])
+    assert ok
+    assert backend.summary()["inputs"] == 0
+
+
+# Export verification and retries
+
+def test_verify_export_problems(tmp_path):
+    report = tmp_path / "Scenario 2.txt"
+    assert ez.verify_export(str(report), 2)[0] == "no output detected"
+    report.touch()
+    assert ez.verify_export(str(report), 2)[0] == "Scenario 2.txt is empty"
+    report.write_text("Scenario 3 AM Existing\n")
+    assert ez.verify_export(str(report), 2, "Scenario 2.txt")[0] == "Scenario 2.txt is a report for scenario 3"
+    assert ez.verify_export(str(report), 2, "Scenario 4.txt")[0] == "wrote Scenario 2.txt instead of Scenario 4.txt"
+    report.write_text("Scenario 2 AM Existing\n")
+    problem, sha256 = ez.verify_export(str(report), 2, "Scenario 2.txt")
+    assert problem is None and sha256 == ez.file_sha256(str(report))
+    assert ez.verify_export(str(report), 2, previous=(str(tmp_path / "other.txt"), sha256))[0] == "duplicate"
+
+    pdf = tmp_path / "Scenario 2.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n1 0 obj\n")
+    assert ez.verify_export(str(pdf), 2)[0] == "Scenario 2.pdf is truncated"
+
+
+def test_missing_export_is_retried(folder):
+    ok, backend, _ = run_batch(folder, backend=FlakyBackend(misses={2: 1}), export_timeout=1)
+    assert ok
+    assert sorted(ez.ExportManifest.load(folder).entries) == ["1", "2", "3", "4"]
+
+
+def test_retry_is_not_a_duplicate_of_its_own_failed_export(folder):
+    # The last scenario first exports the wrong row into its own file; the
+    # retry rewrites that same file and must not be rejected as a duplicate
+    backend = FlakyBackend(wrong_content={4: "EZSynchro dry run\nScenario 1\n"})
+    ok, _, _ = run_batch(folder, backend=backend, export_timeout=1)
+    assert ok
+    assert "Scenario 4" in Path(folder, "Scenario 4.txt").read_text()
+    assert "4" in ez.ExportManifest.load(folder).entries
+
+
+def test_persistent_failure_fails_the_batch(folder):
+    backend = FlakyBackend(misses={3: 3})
+    ok, _, _ = run_batch(folder, backend=backend, export_timeout=1, retries=2)
+    assert not ok
+    assert "3" not in ez.ExportManifest.load(folder).entries
+
+
+# Manifest --resume and --only
+
+def test_resume_skips_verified_scenarios(folder):
+    run_batch(folder)
+    assert ez.plan_scenarios(folder, 4, ".txt", resume=True) == []
+
+    run_batch(folder, backend=AbortingBackend(abort_at=3))
+    assert ez.plan_scenarios(folder, 4, ".txt", resume=True) == [3, 4]
+
+    Path(folder, "Scenario 1.txt").write_text("edited by hand\n")
+    assert ez.plan_scenarios(folder, 4, ".txt", resume=True) == [1, 3, 4]
+
+
+def test_only_narrows_the_plan(folder):
+    assert ez.plan_scenarios(folder, 4, ".txt", only="2-3") == [2, 3]
+    run_batch(folder, scenarios=[1, 2])
+    assert ez.plan_scenarios(folder, 4, ".txt", only="1,3-4", resume=True) == [3, 4]
+
+
+@pytest.mark.parametrize("spec", ["", ",", "2-", "-3", "3-1", "5", "a"])
+def test_invalid_only_selection(spec):
+    with pytest.raises(ValueError):
+        ez.parse_scenario_spec(spec, 4)
+
+
+# Report parsing
+
+def test_iter_report_rows(tmp_path):
+    report = tmp_path / "Scenario 1.txt"
+    report.write_text(SAMPLE_REPORT, encoding="utf-8")
+    rows = list(ez.iter_report_rows(str(report)))
+
+    lane_group = "Lanes, Volumes, Timings / Lane Group"
+    summary = "Lanes, Volumes, Timings / Intersection Summary"
+    intersection = "3: Main St & Oak Ave"
+    assert rows == [
+        ("Scenario 1", lane_group, intersection, "EBL", "Traffic Volume (vph)", "10"),
+        ("Scenario 1", lane_group, intersection, "EBT", "Traffic Volume (vph)", "200"),
+        ("Scenario 1", lane_group, intersection, "EBL", "95th %ile Queue (ft)", "#240"),
+        ("Scenario 1", lane_group, intersection, "EBT", "95th %ile Queue (ft)", "95m"),
+        ("Scenario 1", summary, intersection, "Intersection", "Cycle Length", "90"),
+        ("Scenario 1", summary, intersection, "Intersection", "Intersection Signal Delay", "12.3"),
+        ("Scenario 1", summary, intersection, "Intersection", "Intersection LOS", "B"),
+    ]
+
+
+def test_compare_reads_footnoted_values():
+    key = ("Lane Group", "3: Main St", "EBL", "95th %ile Queue (ft)")
+    assert ez._metric_number("#240") == 240
+    assert ez._metric_number("95m") == 95
+    assert ez._metric_number("62.4%") == 62.4
+    assert ez._metric_number("B") is None
+    deltas = ez.compare_rows([key + ("#240",)], [key + ("260",)])
+    assert deltas == [key + ("#240", "260", "+20.00")]
+
+
+# PDF rendering
+
+def test_render_text_pdf_xref_is_valid(tmp_path):
+    report = tmp_path / "Scenario 1.txt"
+    report.write_text("Page one (with parens) \\ backslash\n\fPage two\n" + "line\n" * 120, encoding="utf-8")
+    data = Path(ez.render_text_pdf(str(report))).read_bytes()
+
+    assert data.startswith(b"%PDF-1.4\n") and data.rstrip().endswith(b"%%EOF")
+    startxref = int(re.search(rb"startxref\n(\d+)\n%%EOF", data).group(1))
+    assert data[startxref:].startswith(b"xref\n")
+
+    count = int(re.match(rb"xref\n0 (\d+)\n", data[startxref:]).group(1))
+    entries = re.findall(rb"(\d{10}) (\d{5}) ([fn]) \n", data[startxref:])
+    assert len(entries) == count
+    for number, (offset, _, kind) in enumerate(entries[1:], 1):
+        assert kind == b"n"
+        assert data[int(offset):].startswith(b"%d 0 obj\n" % number)
+    assert re.search(rb"/Size %d\b" % count, data)
+    # The form feed starts page two, and its 121 lines run on over two more pages
+    assert re.search(rb"/Count 4\b", data)
+
+
+# Calibration
+
+def _screen(menu_open):
+    from PIL import Image, ImageDraw
+    image = Image.new("RGB", (800, 600), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((100, 50, 160, 70), fill="blue")       # scenario menu
+    draw.rectangle((400, 300, 430, 330), fill="green")    # canvas
+    if menu_open:
+        draw.rectangle((100, 80, 200, 100), fill="red")       # first scenario row
+        draw.rectangle((100, 112, 200, 132), fill="orange")   # second row, 32 px lower
+    return image
+
+
+def _templates():
+    closed, opened = _screen(False), _screen(True)
+    return {
+        "scenario_menu": closed.crop((95, 45, 165, 75)),
+        "canvas": closed.crop((395, 295, 435, 335)),
+        "scenario_row": opened.crop((95, 78, 205, 102)),
+        "scenario_row_2": opened.crop((95, 110, 205, 134)),
+    }
+
+
+def _calibration_backend(dpi=96):
+    geometry = {"left": 0, "top": 0, "width": 800, "height": 600, "monitors": 1, "dpi": dpi}
+    return ez.FakeBackend(screenshots=[_screen(False), _screen(True)], geometry=geometry)
+
+
+def test_calibrate_layout_measures_row_pitch():
+    pytest.importorskip("pyscreeze")
+    backend = _calibration_backend()
+    layout = ez.calibrate_layout(backend, _templates(), visible_rows=12)
+
+    assert layout.menu == (130, 60)
+    assert layout.canvas == (415, 315)
+    assert layout.first_row == (150, 90)
+    assert layout.row_pitch == 32
+    assert layout.row(3) == (150, 154)
+    assert layout.visible_rows == 12
+    assert ("click", (130, 60)) in [(event["action"], event["args"]) for event in backend.events]
+
+
+def test_calibrate_layout_scales_default_pitch_by_dpi():
+    pytest.importorskip("pyscreeze")
+    templates = _templates()
+    del templates["scenario_row_2"]
+    layout = ez.calibrate_layout(_calibration_backend(dpi=144), templates)
+    assert layout.row_pitch == round(ez.DEFAULT_ROW_PITCH * 1.5)
+
+
+def test_calibrate_layout_missing_template():
+    pytest.importorskip("pyscreeze")
+    templates = _templates()
+    templates["canvas"] = templates["scenario_row"]
+    with pytest.raises(ValueError, match="canvas"):
+        ez.calibrate_layout(_calibration_backend(), templates)
+
+
+# Key injection benchmark
+
+def test_batched_key_injection_is_faster():
+    bursts = ez.recorded_key_bursts(3)
+    pause = 0.002
+    results = ez.benchmark_key_injection(bursts, pause=pause)
+    per_key, batched = results["per-key"], results["batched"]
+
+    assert per_key["keystrokes"] == batched["keystrokes"]
+    assert batched["calls"] < per_key["calls"]
+    # The wall times come from PyAutoGUIBackend paying each call's PAUSE for real
+    assert per_key["wall"] >= per_key["calls"] * pause
+    assert batched["wall"] < per_key["wall"]